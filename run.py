@@ -12,6 +12,20 @@ import argparse
 import subprocess
 import logging
 
+COMPONENTS = ('beacon', 'tracker')
+
+def _sniff_component(argv):
+    """
+    Find the requested component in the raw argument list.
+    
+    Args:
+        argv: Command line arguments (without the program name)
+        
+    Returns:
+        'beacon', 'tracker', or None if no component was given
+    """
+    return next((arg for arg in argv if arg in COMPONENTS), None)
+
 def setup_logging():
     """Set up basic logging."""
     logging.basicConfig(
@@ -80,11 +94,15 @@ def main():
     """Main entry point."""
     logger = setup_logging()
     
+    # Sniff the component first so only the options that apply to it are built
+    component = _sniff_component(sys.argv[1:])
+    
     parser = argparse.ArgumentParser(description='Run LoRa GPS Tracker components')
-    parser.add_argument('component', choices=['beacon', 'tracker'], 
+    parser.add_argument('component', choices=COMPONENTS, 
                        help='Which component to run (beacon=transmitter, tracker=receiver)')
     parser.add_argument('--debug', action='store_true', help='Enable debug logging')
-    parser.add_argument('--simulate', action='store_true', help='Simulate beacon signals (tracker only)')
+    if component != 'beacon':
+        parser.add_argument('--simulate', action='store_true', help='Simulate beacon signals (tracker only)')
     
     args = parser.parse_args()
     
@@ -8,5 +8,5 @@ setup(
         "pyserial",
         "pycryptodome",
     ],
-    python_requires=">=3.6",
+    python_requires=">=3.7",
 ) 
\ No newline at end of file
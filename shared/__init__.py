@@ -2,19 +2,10 @@
 Shared modules for the LoRa GPS tracker.
 
 This package contains modules shared between the transmitter (beacon) and receiver (tracker).
+Submodules are imported lazily on first attribute access (PEP 562), so importing
+only ``PacketParser`` does not pull in the utility module and vice versa.
 """
 
-from .packet_parser import PacketParser
-from .utils import (
-    setup_logging,
-    calculate_distance,
-    calculate_bearing,
-    format_coordinates,
-    get_timestamp_str,
-    save_location_to_file,
-    load_location_from_file
-)
-
 __all__ = [
     'PacketParser',
     'setup_logging',
@@ -24,4 +15,30 @@ __all__ = [
     'get_timestamp_str',
     'save_location_to_file',
     'load_location_from_file'
-] 
\ No newline at end of file
+]
+
+# Map of public name -> (submodule, attribute) for lazy loading
+_LAZY = {
+    'PacketParser': ('.packet_parser', 'PacketParser'),
+    'setup_logging': ('.utils', 'setup_logging'),
+    'calculate_distance': ('.utils', 'calculate_distance'),
+    'calculate_bearing': ('.utils', 'calculate_bearing'),
+    'format_coordinates': ('.utils', 'format_coordinates'),
+    'get_timestamp_str': ('.utils', 'get_timestamp_str'),
+    'save_location_to_file': ('.utils', 'save_location_to_file'),
+    'load_location_from_file': ('.utils', 'load_location_from_file')
+}
+
+def __getattr__(name):
+    """Import a public name from its submodule on first access."""
+    if name in _LAZY:
+        from importlib import import_module
+        module_name, attr = _LAZY[name]
+        obj = getattr(import_module(module_name, __name__), attr)
+        # Cache in the module namespace so later lookups bypass __getattr__
+        globals()[name] = obj
+        return obj
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
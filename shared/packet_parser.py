@@ -5,9 +5,23 @@ This module handles the formatting and parsing of GPS data packets for LoRa tran
 It provides a consistent format for both the transmitter and receiver components.
 """
 
+from __future__ import annotations
+
 import json
+import math
+import struct
 import time
-from typing import Dict, Any, Optional, Tuple
+
+# Fields that every GPS packet must carry
+_REQUIRED_FIELDS = frozenset(('lat', 'lon', 'ts'))
+
+# Minimal binary packet layout: lat, lon (degrees * 1e6) and timestamp
+_MINIMAL_PACKET = struct.Struct('<iii')
+
+# First byte of a framed minimal packet. JSON packets always start with '{',
+# so a single byte is enough to tell the two formats apart.
+MINIMAL_PACKET_MAGIC = 0xA5
+_MINIMAL_PACKET_FRAMED = struct.Struct('<Biii')
 
 class PacketParser:
     """Parser for LoRa GPS packets."""
@@ -34,24 +48,40 @@ class PacketParser:
         Returns:
             Bytes containing the formatted packet
         """
-        if metadata is None:
-            metadata = {}
+        floats = (latitude, longitude, altitude, hdop, speed, course)
+        if not (all(type(v) is float or type(v) is int for v in floats)
+                and type(satellites) is int and type(fix_quality) is int
+                and math.isfinite(sum(floats))):
+            # NumPy scalars, None, NaN etc. need coercing and the generic JSON encoder
+            packet = json.dumps({
+                "lat": round(float(latitude), 6),
+                "lon": round(float(longitude), 6),
+                "alt": round(float(altitude), 1),
+                "sat": None if satellites is None else int(satellites),
+                "hdop": round(float(hdop), 1),
+                "spd": round(float(speed), 1),
+                "crs": round(float(course), 1),
+                "fix": None if fix_quality is None else int(fix_quality),
+                "ts": int(time.time()),  # Unix timestamp
+                "meta": metadata or {}
+            })
+            return packet.encode('utf-8')
             
-        packet = {
-            "lat": round(latitude, 6),
-            "lon": round(longitude, 6),
-            "alt": round(altitude, 1),
-            "sat": satellites,
-            "hdop": round(hdop, 1),
-            "spd": round(speed, 1),
-            "crs": round(course, 1),
-            "fix": fix_quality,
-            "ts": int(time.time()),  # Unix timestamp
-            "meta": metadata
-        }
+        # Only the free-form metadata needs the generic JSON encoder
+        meta = json.dumps(metadata) if metadata else "{}"
         
-        # Convert to JSON string and then to bytes
-        return json.dumps(packet).encode('utf-8')
+        # The packet shape is fixed, so emit the JSON text directly instead of
+        # building an intermediate dict. For plain finite floats and ints, repr
+        # matches json.dumps output.
+        packet = (
+            f'{{"lat": {round(latitude, 6)!r}, "lon": {round(longitude, 6)!r}, '
+            f'"alt": {round(altitude, 1)!r}, "sat": {satellites}, '
+            f'"hdop": {round(hdop, 1)!r}, "spd": {round(speed, 1)!r}, '
+            f'"crs": {round(course, 1)!r}, "fix": {fix_quality}, '
+            f'"ts": {int(time.time())}, "meta": {meta}}}'  # ts is a Unix timestamp
+        )
+        
+        return packet.encode('utf-8')
     
     @staticmethod
     def parse_gps_packet(packet_bytes: bytes) -> Dict[str, Any]:
@@ -71,11 +101,10 @@ class PacketParser:
             packet_str = packet_bytes.decode('utf-8')
             packet_data = json.loads(packet_str)
             
-            # Validate required fields
-            required_fields = ['lat', 'lon', 'ts']
-            for field in required_fields:
-                if field not in packet_data:
-                    raise ValueError(f"Missing required field: {field}")
+            # Validate required fields (reports every missing field at once)
+            missing = _REQUIRED_FIELDS - packet_data.keys()
+            if missing:
+                raise ValueError(f"Missing required fields: {sorted(missing)}")
                     
             return packet_data
             
@@ -88,6 +117,7 @@ class PacketParser:
         Create a minimal binary packet format for scenarios where bandwidth conservation is critical.
         
         Format:
+        - 1 byte: MINIMAL_PACKET_MAGIC (0xA5)
         - 4 bytes: Latitude (encoded as int32, multiplied by 1,000,000)
         - 4 bytes: Longitude (encoded as int32, multiplied by 1,000,000)
         - 4 bytes: Timestamp (Unix timestamp as uint32)
@@ -100,8 +130,6 @@ class PacketParser:
         Returns:
             Binary packet as bytes
         """
-        import struct
-        
         if timestamp is None:
             timestamp = int(time.time())
             
@@ -109,8 +137,8 @@ class PacketParser:
         lat_int = int(latitude * 1000000)
         lon_int = int(longitude * 1000000)
         
-        # Pack into binary format (12 bytes total)
-        return struct.pack('<iii', lat_int, lon_int, timestamp)
+        # Pack into binary format (13 bytes total)
+        return _MINIMAL_PACKET_FRAMED.pack(MINIMAL_PACKET_MAGIC, lat_int, lon_int, timestamp)
         
     @staticmethod
     def decode_minimal_packet(packet_bytes: bytes) -> Tuple[float, float, int]:
@@ -118,7 +146,9 @@ class PacketParser:
         Decode a minimal binary packet.
         
         Args:
-            packet_bytes: Binary packet data (12 bytes)
+            packet_bytes: Binary packet data (any bytes-like object): 13 bytes
+                starting with MINIMAL_PACKET_MAGIC, or the unframed 12 bytes
+                sent by older transmitters
             
         Returns:
             Tuple of (latitude, longitude, timestamp)
@@ -126,13 +156,19 @@ class PacketParser:
         Raises:
             ValueError: If the packet is invalid
         """
-        import struct
-        
-        if len(packet_bytes) != 12:
-            raise ValueError(f"Invalid packet length: {len(packet_bytes)}, expected 12 bytes")
+        size = len(packet_bytes)
+        if size == _MINIMAL_PACKET_FRAMED.size:
+            if packet_bytes[0] != MINIMAL_PACKET_MAGIC:
+                raise ValueError(f"Invalid packet magic: 0x{packet_bytes[0]:02X}, expected 0x{MINIMAL_PACKET_MAGIC:02X}")
+            offset = 1
+        elif size == _MINIMAL_PACKET.size:
+            offset = 0
+        else:
+            raise ValueError(f"Invalid packet length: {size}, expected {_MINIMAL_PACKET_FRAMED.size} "
+                             f"(framed) or {_MINIMAL_PACKET.size} bytes")
             
         try:
-            lat_int, lon_int, timestamp = struct.unpack('<iii', packet_bytes)
+            lat_int, lon_int, timestamp = _MINIMAL_PACKET.unpack_from(packet_bytes, offset)
             
             # Convert back to floating point
             latitude = lat_int / 1000000.0
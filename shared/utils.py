@@ -4,11 +4,30 @@ Utility Functions Module
 This module provides common utility functions used across the GPS tracker system.
 """
 
+from __future__ import annotations
+
 import math
 import logging
 import time
 import os
-from typing import Tuple, Optional, Dict, Any
+
+# Degree/radian conversion factors
+_DEG2RAD = math.pi / 180.0
+_RAD2DEG = 180.0 / math.pi
+
+# Directories already created by this process
+_created_dirs = set()
+
+def _ensure_dir(path: str) -> None:
+    """
+    Create a directory if needed, at most once per process.
+    
+    Args:
+        path: Directory to create
+    """
+    if path and path not in _created_dirs:
+        os.makedirs(path, exist_ok=True)
+        _created_dirs.add(path)
 
 def setup_logging(name: str, log_dir: str = "logs", level: int = logging.INFO) -> logging.Logger:
     """
@@ -23,7 +42,7 @@ def setup_logging(name: str, log_dir: str = "logs", level: int = logging.INFO) -
         Configured logger instance
     """
     # Create logs directory if it doesn't exist
-    os.makedirs(log_dir, exist_ok=True)
+    _ensure_dir(log_dir)
     
     # Create logger
     logger = logging.getLogger(name)
@@ -66,10 +85,10 @@ def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     radius = 6371000
     
     # Convert to radians
-    lat1_rad = math.radians(lat1)
-    lon1_rad = math.radians(lon1)
-    lat2_rad = math.radians(lat2)
-    lon2_rad = math.radians(lon2)
+    lat1_rad = lat1 * _DEG2RAD
+    lon1_rad = lon1 * _DEG2RAD
+    lat2_rad = lat2 * _DEG2RAD
+    lon2_rad = lon2 * _DEG2RAD
     
     # Haversine formula
     dlat = lat2_rad - lat1_rad
@@ -94,10 +113,10 @@ def calculate_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> flo
         Bearing in degrees (0-360, where 0 is North)
     """
     # Convert to radians
-    lat1_rad = math.radians(lat1)
-    lon1_rad = math.radians(lon1)
-    lat2_rad = math.radians(lat2)
-    lon2_rad = math.radians(lon2)
+    lat1_rad = lat1 * _DEG2RAD
+    lon1_rad = lon1 * _DEG2RAD
+    lat2_rad = lat2 * _DEG2RAD
+    lon2_rad = lon2 * _DEG2RAD
     
     # Calculate bearing
     y = math.sin(lon2_rad - lon1_rad) * math.cos(lat2_rad)
@@ -105,7 +124,7 @@ def calculate_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> flo
     bearing_rad = math.atan2(y, x)
     
     # Convert to degrees
-    bearing_deg = math.degrees(bearing_rad)
+    bearing_deg = bearing_rad * _RAD2DEG
     
     # Normalize to 0-360
     bearing_normalized = (bearing_deg + 360) % 360
@@ -184,11 +203,32 @@ def save_location_to_file(location_data: Dict[str, Any], filename: str = "last_l
         location_data: Dictionary containing location data
         filename: File to save the data to
     """
-    import json
-    
     try:
-        with open(filename, 'w') as f:
-            json.dump(location_data, f, indent=2)
+        # Serialize in one shot so the file is written with a single syscall
+        try:
+            import orjson
+            data = orjson.dumps(
+                location_data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            )
+        except (ImportError, TypeError):
+            # No orjson, or a value it cannot serialize that json can
+            import json
+            data = json.dumps(location_data, indent=2).encode('utf-8')
+        
+        # Make sure the target directory exists
+        _ensure_dir(os.path.dirname(filename))
+        
+        # Write to a temporary file and atomically replace the target
+        tmp_filename = filename + '.tmp'
+        fd = os.open(tmp_filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_filename, filename)
     except Exception as e:
         logging.error(f"Failed to save location data: {e}")
 
@@ -12,11 +12,11 @@ import os
 import shutil
 import sys
 
+# Directory containing this script (resolved once)
+_HERE = os.path.dirname(os.path.realpath(__file__))
+
 # Path to the original SX126x.py file
-SX126X_PATH = os.path.join(
-    os.path.dirname(os.path.realpath(__file__)),
-    'sx126x_lorawan_hat_code/python/lora/LoRaRF/SX126x.py'
-)
+SX126X_PATH = os.path.join(_HERE, 'sx126x_lorawan_hat_code/python/lora/LoRaRF/SX126x.py')
 
 # Path to the backup file
 BACKUP_PATH = SX126X_PATH + '.backup'
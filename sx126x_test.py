@@ -1,8 +1,11 @@
 import os, sys
 import time
 
+# Directory containing this script (resolved once)
+_HERE = os.path.dirname(os.path.realpath(__file__))
+
 # Add path to the LoRaRF module
-sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), 'sx126x_lorawan_hat_code/python/lora'))
+sys.path.append(os.path.join(_HERE, 'sx126x_lorawan_hat_code/python/lora'))
 from LoRaRF import SX126x
 
 # Pin definitions for Waveshare SX1262 LoRaWAN/GNSS HAT
@@ -64,9 +67,7 @@ print("\n-- SX1262 LoRa Initialization Complete --\n")
 
 print("Testing transmit functionality...")
 message = "Hello from SX1262!"
-messageList = list(message)
-for i in range(len(messageList)):
-    messageList[i] = ord(messageList[i])
+messageList = list(message.encode('ascii'))
 
 # Transmit the test message
 LoRa.beginPacket()
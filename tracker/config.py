@@ -2,83 +2,173 @@
 Configuration for the LoRa GPS Tracker (Receiver)
 
 This file contains all configuration parameters for the receiver/tracker.
+
+All settings live on the frozen CONFIG object; ``CONFIG.X`` is the preferred
+way to read them. ``from tracker.config import X`` keeps working through the
+module-level __getattr__ below.
 """
 
 import os
 import logging
-from typing import Dict, Any, Tuple
-
-# Logging configuration
-LOG_LEVEL = logging.INFO  # DEBUG, INFO, WARNING, ERROR, CRITICAL
-LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "logs")
-os.makedirs(LOG_DIR, exist_ok=True)
-LOG_FILE = os.path.join(LOG_DIR, "tracker.log")
-
-# Application settings
-APP_NAME = "LoRa GPS Tracker"
-SHUTDOWN_TIMEOUT = 5  # seconds to wait during graceful shutdown
-
-# Screen display settings
-DISPLAY_ENABLED = True  # Set to False if no display is connected
-DISPLAY_WIDTH = 320     # LCD width in pixels (if used)
-DISPLAY_HEIGHT = 240    # LCD height in pixels (if used)
-DISPLAY_UPDATE_INTERVAL = 1.0  # seconds between display updates
-DISPLAY_TIMEOUT = 60    # seconds before dimming the display (0 = never)
-DISPLAY_ROTATION = 0    # 0, 90, 180, or 270 degrees
-
-# Map settings
-MAP_CENTER_ON_BEACON = True  # Center map on beacon location
-MAP_SCALE = 50  # meters per 100 pixels (approximate)
-MAP_TRAIL_LENGTH = 10  # Number of previous beacon positions to show
-MAP_SHOW_COMPASS = True  # Show compass on display
-
-# LoRa SPI configuration
-LORA_USING_SPI = True   # Set to True to use SPI instead of UART
-LORA_SPI_BUS = 0        # SPI bus ID
-LORA_SPI_CS = 0         # Chip select ID (0 for /dev/spidev0.0)
-LORA_RESET_PIN = 18     # Reset pin (GPIO 18)
-LORA_BUSY_PIN = 20      # Busy pin (GPIO 20)
-LORA_DIO1_PIN = 16      # DIO1 pin (GPIO 16)
-LORA_IRQ_PIN = LORA_DIO1_PIN  # Alias for IRQ pin
-LORA_TXEN_PIN = 6       # TX enable pin
-LORA_RXEN_PIN = -1      # RX enable pin (not used with SX126X)
-LORA_SPI_SPEED = 2000000  # SPI speed in Hz (2 MHz)
-
-# GPS configuration (if GPS is available on the receiver)
-GPS_ENABLED = True      # Set to False if no GPS module is connected
-GPS_PORT = "/dev/ttyAMA0"  # Serial port for GPS module
-GPS_BAUD_RATE = 9600    # Baud rate for GPS module
-GPS_TIMEOUT = 1.0       # Serial timeout for GPS module
-
-# LoRa configuration
-LORA_CONFIG = {
-    "frequency": 868000000,  # 868 MHz
-    "bandwidth": 125000,     # 125 kHz
-    "spreading_factor": 7,
-    "coding_rate": 5,        # 4/5
-    "preamble_length": 8,
-    "sync_word": 0x12,
-    "power": 20,             # dBm
-    "current_limit": 100,    # mA
-    "crc": True
-}
-LORA_ENCRYPTION_KEY = "0123456789ABCDEF"  # 16-byte AES key (must match transmitter)
-LORA_MESSAGE_QUEUE_SIZE = 20
-LORA_RX_CONTINUOUS = True  # Continuously listen for packets
-
-# Data storage settings
-DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
-os.makedirs(DATA_DIR, exist_ok=True)
-LOCATION_LOG_FILE = os.path.join(DATA_DIR, "location_log.csv")
-LOCATION_HISTORY_SIZE = 1000  # Number of locations to keep in memory
-
-# Alert settings
-ALERT_SOUND_ENABLED = False  # Sound alerts when beacon is detected
-ALERT_DISTANCE_THRESHOLD = 100  # Distance in meters to trigger proximity alert
-
-# Debug settings
-DEBUG_MODE = True  # Enable debug mode
-SIMULATE_BEACON = False  # Simulate beacon data (for testing without transmitter)
-# Default simulated location (for testing)
-SIMULATE_BEACON_LOCATION = (51.5074, -0.1278)  # London coordinates 
\ No newline at end of file
+from dataclasses import dataclass, field, fields
+from typing import Dict, Any, Optional, Tuple
+
+# Project root directory (parent of the tracker package)
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_LOG_DIR = os.path.join(_BASE_DIR, "logs")
+_DATA_DIR = os.path.join(_BASE_DIR, "data")
+
+@dataclass(frozen=True)
+class _Config:
+    """Tracker configuration values."""
+
+    # Project root directory
+    BASE_DIR: str = _BASE_DIR
+
+    # Logging configuration
+    LOG_LEVEL: int = logging.INFO  # DEBUG, INFO, WARNING, ERROR, CRITICAL
+    LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    LOG_DIR: str = _LOG_DIR
+    LOG_FILE: Optional[str] = None  # Defaults to LOG_DIR/tracker.log
+
+    # Application settings
+    APP_NAME: str = "LoRa GPS Tracker"
+    SHUTDOWN_TIMEOUT: int = 5  # seconds to wait during graceful shutdown
+
+    # Screen display settings
+    DISPLAY_ENABLED: bool = True  # Set to False if no display is connected
+    DISPLAY_WIDTH: int = 320      # LCD width in pixels (if used)
+    DISPLAY_HEIGHT: int = 240     # LCD height in pixels (if used)
+    DISPLAY_UPDATE_INTERVAL: float = 1.0  # seconds between display updates
+    DISPLAY_TIMEOUT: int = 60     # seconds before dimming the display (0 = never)
+    DISPLAY_ROTATION: int = 0     # 0, 90, 180, or 270 degrees
+
+    # Map settings
+    MAP_CENTER_ON_BEACON: bool = True  # Center map on beacon location
+    MAP_SCALE: int = 50  # meters per 100 pixels (approximate)
+    MAP_TRAIL_LENGTH: int = 10  # Number of previous beacon positions to show
+    MAP_SHOW_COMPASS: bool = True  # Show compass on display
+
+    # LoRa SPI configuration
+    LORA_USING_SPI: bool = True   # Set to True to use SPI instead of UART
+    LORA_SPI_BUS: int = 0         # SPI bus ID
+    LORA_SPI_CS: int = 0          # Chip select ID (0 for /dev/spidev0.0)
+    LORA_RESET_PIN: int = 18      # Reset pin (GPIO 18)
+    LORA_BUSY_PIN: int = 20       # Busy pin (GPIO 20)
+    LORA_DIO1_PIN: int = 16       # DIO1 pin (GPIO 16)
+    LORA_IRQ_PIN: Optional[int] = None  # Alias for IRQ pin (defaults to LORA_DIO1_PIN)
+    LORA_TXEN_PIN: int = 6        # TX enable pin
+    LORA_RXEN_PIN: int = -1       # RX enable pin (not used with SX126X)
+    LORA_SPI_SPEED: int = 2000000  # SPI speed in Hz (2 MHz)
+
+    # GPS configuration (if GPS is available on the receiver)
+    GPS_ENABLED: bool = True      # Set to False if no GPS module is connected
+    GPS_PORT: str = "/dev/ttyAMA0"  # Serial port for GPS module
+    GPS_BAUD_RATE: int = 9600     # Baud rate for GPS module
+    GPS_TIMEOUT: float = 1.0      # Serial timeout for GPS module
+
+    # LoRa configuration
+    LORA_CONFIG: Dict[str, Any] = field(default_factory=lambda: {
+        "frequency": 868000000,  # 868 MHz
+        "bandwidth": 125000,     # 125 kHz
+        "spreading_factor": 7,
+        "coding_rate": 5,        # 4/5
+        "preamble_length": 8,
+        "sync_word": 0x12,
+        "power": 20,             # dBm
+        "current_limit": 100,    # mA
+        "crc": True
+    })
+    LORA_ENCRYPTION_KEY: str = "0123456789ABCDEF"  # 16-byte AES key (must match transmitter)
+    LORA_MESSAGE_QUEUE_SIZE: int = 20
+    LORA_RX_CONTINUOUS: bool = True  # Continuously listen for packets
+
+    # Data storage settings
+    DATA_DIR: str = _DATA_DIR
+    LOCATION_LOG_FILE: Optional[str] = None  # Defaults to DATA_DIR/location_log.csv
+    LOCATION_HISTORY_SIZE: int = 1000  # Number of locations to keep in memory
+    LOCATION_LOG_FLUSH_ROWS: int = 20  # Flush the location log after this many rows
+    LOCATION_LOG_FLUSH_INTERVAL: float = 10.0  # ... or when this many seconds have passed
+
+    # Alert settings
+    ALERT_SOUND_ENABLED: bool = False  # Sound alerts when beacon is detected
+    ALERT_DISTANCE_THRESHOLD: int = 100  # Distance in meters to trigger proximity alert
+
+    # Debug settings
+    DEBUG_MODE: bool = True  # Enable debug mode
+    SIMULATE_BEACON: bool = False  # Simulate beacon data (for testing without transmitter)
+    # Default simulated location (for testing)
+    SIMULATE_BEACON_LOCATION: Tuple[float, float] = (51.5074, -0.1278)  # London coordinates
+
+    def __post_init__(self):
+        if self.LORA_IRQ_PIN is None:
+            object.__setattr__(self, 'LORA_IRQ_PIN', self.LORA_DIO1_PIN)
+        if self.LOG_FILE is None:
+            object.__setattr__(self, 'LOG_FILE', os.path.join(self.LOG_DIR, "tracker.log"))
+        if self.LOCATION_LOG_FILE is None:
+            object.__setattr__(self, 'LOCATION_LOG_FILE', os.path.join(self.DATA_DIR, "location_log.csv"))
+
+# Optional local overrides (UPPERCASE names in config_local.py at the project root)
+_LOCAL_CONFIG_PATH = os.path.join(_BASE_DIR, "config_local.py")
+_LOCAL_CONFIG_CACHE = os.path.join(os.path.expanduser("~"), ".cache", "loragpstracker", "config.pkl")
+
+def _load_local_overrides() -> Dict[str, Any]:
+    """
+    Load configuration overrides from config_local.py.
+    
+    All UPPERCASE names in the file are cached in a pickle keyed by the
+    file's path and modification time, so the module is only executed when
+    it changes. They are matched against the current settings on every load,
+    so the cache stays valid when settings are added or removed.
+    
+    Returns:
+        Dictionary of setting name to value, empty if there is no local config
+    """
+    try:
+        mtime = os.stat(_LOCAL_CONFIG_PATH).st_mtime_ns
+    except OSError:
+        return {}
+        
+    import pickle
+    
+    key = (_LOCAL_CONFIG_PATH, mtime)
+    values = None
+    try:
+        with open(_LOCAL_CONFIG_CACHE, 'rb') as f:
+            cached_key, cached_values = pickle.load(f)
+        if cached_key == key:
+            values = cached_values
+    except Exception:
+        pass  # Missing or unreadable cache, rebuild it below
+        
+    if values is None:
+        import importlib.util
+        
+        spec = importlib.util.spec_from_file_location("config_local", _LOCAL_CONFIG_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        
+        values = {k: v for k, v in vars(module).items() if k.isupper()}
+        
+        try:
+            os.makedirs(os.path.dirname(_LOCAL_CONFIG_CACHE), exist_ok=True)
+            with open(_LOCAL_CONFIG_CACHE, 'wb') as f:
+                pickle.dump((key, values), f)
+        except Exception:
+            pass  # Caching is best effort
+            
+    names = {f.name for f in fields(_Config)}
+    return {k: v for k, v in values.items() if k in names}
+
+# Active configuration
+CONFIG = _Config(**_load_local_overrides())
+
+_FIELD_NAMES = frozenset(f.name for f in fields(_Config))
+
+__all__ = ['CONFIG'] + [f.name for f in fields(_Config)]
+
+def __getattr__(name):
+    """Expose configuration values as module attributes for compatibility."""
+    if name in _FIELD_NAMES:
+        return getattr(CONFIG, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
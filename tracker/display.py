@@ -7,17 +7,16 @@ It supports both console output and graphical display if available.
 
 import time
 import logging
-import os
+import sys
 import threading
+import functools
+import importlib.util
+from collections import deque
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 import math
 
-from tracker.config import (
-    DISPLAY_ENABLED, DISPLAY_UPDATE_INTERVAL, DISPLAY_WIDTH, DISPLAY_HEIGHT,
-    DISPLAY_ROTATION, MAP_CENTER_ON_BEACON, MAP_SCALE, MAP_TRAIL_LENGTH,
-    MAP_SHOW_COMPASS
-)
+from tracker.config import CONFIG
 
 from shared.utils import (
     format_coordinates, calculate_distance, calculate_bearing, get_timestamp_str
@@ -26,6 +25,15 @@ from shared.utils import (
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Maximum number of rendered text surfaces kept by DisplayHandler._render
+TEXT_CACHE_SIZE = 64
+
+# (sin, cos) for each whole-degree bearing, used to place the tracker on the map
+_SINCOS_TABLE = [(math.sin(math.radians(d)), math.cos(math.radians(d))) for d in range(360)]
+
+# (sin, cos) of the tracker triangle's vertex offsets in radians
+_TRIANGLE_OFFSETS = [(math.sin(a), math.cos(a)) for a in (0.0, 2.1, -2.1)]
+
 class DisplayHandler:
     """
     Handler for displaying GPS tracking information.
@@ -40,17 +48,37 @@ class DisplayHandler:
     
     def __init__(self):
         """Initialize the display handler."""
-        self.enabled = DISPLAY_ENABLED
-        self.update_interval = DISPLAY_UPDATE_INTERVAL
+        self.enabled = CONFIG.DISPLAY_ENABLED
+        self.update_interval = CONFIG.DISPLAY_UPDATE_INTERVAL
+        
+        # Snapshot of display/map settings used on every frame
+        self._w = CONFIG.DISPLAY_WIDTH
+        self._h = CONFIG.DISPLAY_HEIGHT
+        self._center = CONFIG.MAP_CENTER_ON_BEACON
+        self._scale_px_per_m = 100.0 / CONFIG.MAP_SCALE  # MAP_SCALE is meters per 100 pixels
+        self._trail = CONFIG.MAP_TRAIL_LENGTH
         self.display = None
+        self.display_type = None
         self.screen = None
+        self.fonts = {}
+        self._bg = None          # Pre-rendered static background surface
+        self._title_surf = None  # Pre-rendered title text
+        self._pg_ready = False  # Set once pygame has been imported and initialized
+        self._text_cache = {}   # Rendered text surfaces keyed by (font, text, color)
+        self._geo_cache = (None, None, None, None)  # (tracker, beacon, distance, bearing)
+        self._clear_seq = "\x1b[2J\x1b[H"  # ANSI: clear screen, cursor to home
+        
+        # Formatting results only change when a new position/timestamp arrives
+        self._fmt_coord = functools.lru_cache(maxsize=8)(format_coordinates)
+        self._fmt_ts = functools.lru_cache(maxsize=8)(get_timestamp_str)
         self.update_thread = None
         self.stop_event = threading.Event()
+        self._dirty = threading.Event()  # Set when the display needs a redraw
         
         # Tracking data
         self.tracker_position = None  # Tuple of (lat, lon) for tracker
         self.beacon_position = None   # Tuple of (lat, lon) for beacon
-        self.beacon_history = []      # List of previous beacon positions
+        self.beacon_history = deque(maxlen=self._trail)  # Previous beacon positions (oldest first)
         self.last_update_time = 0     # Unix timestamp of last update
         self.signal_strength = 0      # RSSI value in dBm
         self.signal_quality = 0       # SNR value in dB
@@ -61,47 +89,63 @@ class DisplayHandler:
         
     def _init_display(self) -> bool:
         """
-        Initialize the display device.
+        Probe which display device is available.
+        
+        Only checks whether pygame is installed; the pygame import itself is
+        deferred to the first frame (see _init_pygame) so console and headless
+        runs never load SDL.
         
         Returns:
             bool: True if successfully initialized, False otherwise.
         """
         try:
-            # Try to import pygame for graphical display
-            try:
-                import pygame
-                
-                # Initialize pygame
-                pygame.init()
-                
-                # Set up the screen
-                self.screen = pygame.display.set_mode((DISPLAY_WIDTH, DISPLAY_HEIGHT))
-                pygame.display.set_caption("LoRa GPS Tracker")
-                
-                # Load fonts
-                self.fonts = {
-                    'small': pygame.font.Font(None, 20),
-                    'medium': pygame.font.Font(None, 24),
-                    'large': pygame.font.Font(None, 32),
-                    'title': pygame.font.Font(None, 40)
-                }
-                
-                # Set display type
-                self.display_type = "pygame"
-                logger.info("Initialized Pygame display")
-                return True
-                
-            except ImportError:
+            if importlib.util.find_spec("pygame") is None:
                 # If pygame isn't available, fall back to console display
                 logger.warning("Pygame not available, using console display instead")
                 self.display_type = "console"
                 return True
                 
+            # Set display type
+            self.display_type = "pygame"
+            logger.info("Pygame available, display will be initialized on first update")
+            return True
+                
         except Exception as e:
             logger.error(f"Failed to initialize display: {e}")
             self.enabled = False
             return False
         
+    def _init_pygame(self) -> None:
+        """
+        Import and initialize pygame, create the screen and load fonts.
+        """
+        import pygame
+        
+        # Initialize pygame
+        pygame.init()
+        
+        # Set up the screen
+        self.screen = pygame.display.set_mode((self._w, self._h))
+        pygame.display.set_caption("LoRa GPS Tracker")
+        
+        # Load fonts
+        self.fonts = {
+            'small': pygame.font.Font(None, 20),
+            'medium': pygame.font.Font(None, 24),
+            'large': pygame.font.Font(None, 32),
+            'title': pygame.font.Font(None, 40)
+        }
+        
+        # Pre-render the static background: black fill, header bar and map area
+        self._bg = pygame.Surface((self._w, self._h))
+        self._bg.fill((0, 0, 0))
+        pygame.draw.rect(self._bg, (0, 0, 80), (0, 0, self._w, 50))
+        pygame.draw.rect(self._bg, (20, 20, 20), (10, 60, self._w - 20, self._h - 120))
+        self._title_surf = self.fonts['title'].render("LoRa GPS Tracker", True, (255, 255, 255))
+        
+        self._pg_ready = True
+        logger.info("Initialized Pygame display")
+        
     def start(self) -> bool:
         """
         Start the display update thread.
@@ -119,6 +163,9 @@ class DisplayHandler:
             
         self.stop_event.clear()
         
+        # Draw the first frame straight away
+        self._dirty.set()
+        
         # Start update thread
         self.update_thread = threading.Thread(target=self._update_worker, daemon=True)
         self.update_thread.start()
@@ -129,6 +176,7 @@ class DisplayHandler:
     def stop(self) -> None:
         """Stop the display update thread."""
         self.stop_event.set()
+        self._dirty.set()  # Wake the worker so it sees stop_event
         
         if self.update_thread:
             self.update_thread.join(timeout=2.0)
@@ -136,8 +184,9 @@ class DisplayHandler:
         logger.info("Display update thread stopped")
         
         # Clean up display
-        if self.display_type == "pygame":
+        if self._pg_ready:
             import pygame
+            self._pg_ready = False
             pygame.quit()
         
     def update_beacon_position(self, position: Tuple[float, float], 
@@ -151,17 +200,16 @@ class DisplayHandler:
             timestamp: Unix timestamp of the position update, or None for current time
             metadata: Additional metadata (signal strength, etc.)
         """
+        # Read the clock once so history and last update time agree
+        now = timestamp or int(time.time())
+        
         self.beacon_position = position
         
-        # Add to history (limit to MAP_TRAIL_LENGTH entries)
+        # Add to history (the deque drops entries beyond MAP_TRAIL_LENGTH)
         self.beacon_history.append({
             'position': position,
-            'timestamp': timestamp or int(time.time())
+            'timestamp': now
         })
-        
-        # Keep history within size limit
-        if len(self.beacon_history) > MAP_TRAIL_LENGTH:
-            self.beacon_history = self.beacon_history[-MAP_TRAIL_LENGTH:]
             
         # Update signal info if provided
         if metadata:
@@ -170,7 +218,10 @@ class DisplayHandler:
             if 'snr' in metadata:
                 self.signal_quality = metadata['snr']
                 
-        self.last_update_time = timestamp or int(time.time())
+        self.last_update_time = now
+        
+        # Request a redraw
+        self._dirty.set()
         
     def update_tracker_position(self, position: Tuple[float, float]) -> None:
         """
@@ -179,7 +230,11 @@ class DisplayHandler:
         Args:
             position: Tuple of (latitude, longitude)
         """
-        self.tracker_position = position
+        if position != self.tracker_position:
+            self.tracker_position = position
+            
+            # Request a redraw
+            self._dirty.set()
         
     def _update_worker(self) -> None:
         """
@@ -188,9 +243,19 @@ class DisplayHandler:
         logger.info("Display update worker started")
         
         while not self.stop_event.is_set():
+            # Only redraw when tracking data has changed; the timeout just
+            # lets the loop notice stop_event
+            if not self._dirty.wait(timeout=self.update_interval):
+                continue
+            if self.stop_event.is_set():
+                break
+            self._dirty.clear()
+            
             try:
                 self._update_display()
-                time.sleep(self.update_interval)
+                
+                # Redraw at most once per update interval
+                self.stop_event.wait(self.update_interval)
             except Exception as e:
                 logger.error(f"Error updating display: {e}")
                 time.sleep(1.0)  # Pause on error to prevent log flooding
@@ -206,59 +271,111 @@ class DisplayHandler:
         else:
             self._update_console_display()
             
+    def _get_distance_and_bearing(self) -> Tuple[float, float]:
+        """
+        Get the distance and bearing from the tracker to the beacon.
+        
+        The result is cached and only recomputed when either position changes.
+        
+        Returns:
+            Tuple of (distance in meters, bearing in degrees)
+        """
+        tracker_position = self.tracker_position
+        beacon_position = self.beacon_position
+        
+        cached_tracker, cached_beacon, distance, bearing = self._geo_cache
+        if cached_tracker == tracker_position and cached_beacon == beacon_position:
+            return distance, bearing
+            
+        distance = calculate_distance(
+            tracker_position[0], tracker_position[1],
+            beacon_position[0], beacon_position[1]
+        )
+        bearing = calculate_bearing(
+            tracker_position[0], tracker_position[1],
+            beacon_position[0], beacon_position[1]
+        )
+        self._geo_cache = (tracker_position, beacon_position, distance, bearing)
+        return distance, bearing
+        
+    def _render(self, font_key: str, text: str, color: Tuple[int, int, int]):
+        """
+        Render text with one of the loaded fonts, reusing cached surfaces.
+        
+        Args:
+            font_key: Key into self.fonts
+            text: Text to render
+            color: RGB text color
+            
+        Returns:
+            pygame Surface containing the rendered text
+        """
+        key = (font_key, text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = self.fonts[font_key].render(text, True, color)
+            
+            # Evict the oldest entry to keep the cache bounded
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                self._text_cache.pop(next(iter(self._text_cache)))
+            self._text_cache[key] = surface
+        return surface
+        
     def _update_pygame_display(self) -> None:
         """
         Update the pygame graphical display.
         """
         import pygame
         
-        # Get the screen surface
-        screen = self.screen
-        
-        # Fill the background
-        screen.fill((0, 0, 0))  # Black background
+        # Initialize pygame on the first frame, falling back to the console
+        # if no video device is available
+        if not self._pg_ready:
+            try:
+                self._init_pygame()
+            except Exception as e:
+                logger.warning(f"Failed to initialize Pygame display ({e}), using console display instead")
+                pygame.quit()
+                self.display_type = "console"
+                self._update_console_display()
+                return
         
-        # Header
-        pygame.draw.rect(screen, (0, 0, 80), (0, 0, DISPLAY_WIDTH, 50))
-        title = self.fonts['title'].render("LoRa GPS Tracker", True, (255, 255, 255))
-        screen.blit(title, (DISPLAY_WIDTH // 2 - title.get_width() // 2, 10))
+        # Get the screen surface and dimensions
+        screen = self.screen
+        width = self._w
+        height = self._h
         
-        # Draw map area background
-        pygame.draw.rect(screen, (20, 20, 20), (10, 60, DISPLAY_WIDTH - 20, DISPLAY_HEIGHT - 120))
+        # Static background (header and map area) and title
+        screen.blit(self._bg, (0, 0))
+        screen.blit(self._title_surf, (width // 2 - self._title_surf.get_width() // 2, 10))
         
         # Draw beacon position if available
         if self.beacon_position:
             # Draw current position (large red dot)
-            map_center_x = DISPLAY_WIDTH // 2
-            map_center_y = (DISPLAY_HEIGHT - 60) // 2 + 60
+            map_center_x = width // 2
+            map_center_y = (height - 60) // 2 + 60
             
             # Draw the map
-            if MAP_CENTER_ON_BEACON:
+            if self._center:
                 pygame.draw.circle(screen, (255, 0, 0), (map_center_x, map_center_y), 8)
                 
                 # Draw beacon position text
-                pos_text = self.fonts['medium'].render(
-                    f"Beacon: {format_coordinates(*self.beacon_position)}", 
-                    True, (255, 200, 200))
-                screen.blit(pos_text, (20, DISPLAY_HEIGHT - 50))
+                pos_text = self._render(
+                    'medium',
+                    f"Beacon: {self._fmt_coord(*self.beacon_position)}", 
+                    (255, 200, 200))
+                screen.blit(pos_text, (20, height - 50))
                 
                 # Draw tracker position if available
                 if self.tracker_position:
                     # Calculate relative position to beacon
-                    distance = calculate_distance(
-                        self.tracker_position[0], self.tracker_position[1],
-                        self.beacon_position[0], self.beacon_position[1]
-                    )
-                    bearing = calculate_bearing(
-                        self.tracker_position[0], self.tracker_position[1],
-                        self.beacon_position[0], self.beacon_position[1]
-                    )
+                    distance, bearing = self._get_distance_and_bearing()
                     
                     # Convert polar (distance, bearing) to cartesian for display
                     # Note: On screen, y-axis is inverted (positive is down)
-                    scale_factor = 100.0 / MAP_SCALE  # pixels per meter
-                    rel_x = distance * scale_factor * math.sin(math.radians(bearing))
-                    rel_y = -distance * scale_factor * math.cos(math.radians(bearing))
+                    scale_factor = self._scale_px_per_m  # pixels per meter
+                    sin_b, cos_b = _SINCOS_TABLE[round(bearing) % 360]
+                    rel_x = distance * scale_factor * sin_b
+                    rel_y = -distance * scale_factor * cos_b
                     
                     # Draw tracker position (blue triangle)
                     tracker_x = map_center_x - int(rel_x)
@@ -266,16 +383,17 @@ class DisplayHandler:
                     
                     # Triangle points
                     triangle_size = 10
-                    # Calculate triangle vertices based on bearing
-                    tracker_angle = math.radians(bearing - 180)  # Point towards beacon
-                    tx1 = tracker_x + int(triangle_size * math.sin(tracker_angle))
-                    ty1 = tracker_y - int(triangle_size * math.cos(tracker_angle))
-                    tx2 = tracker_x + int(triangle_size * math.sin(tracker_angle + 2.1))
-                    ty2 = tracker_y - int(triangle_size * math.cos(tracker_angle + 2.1))
-                    tx3 = tracker_x + int(triangle_size * math.sin(tracker_angle - 2.1))
-                    ty3 = tracker_y - int(triangle_size * math.cos(tracker_angle - 2.1))
+                    # Calculate triangle vertices based on bearing, pointing towards
+                    # the beacon (bearing - 180); sin/cos of the vertex angles come
+                    # from the angle-sum identities
+                    sin_a, cos_a = -sin_b, -cos_b
+                    triangle = [
+                        (tracker_x + int(triangle_size * (sin_a * cos_o + cos_a * sin_o)),
+                         tracker_y - int(triangle_size * (cos_a * cos_o - sin_a * sin_o)))
+                        for sin_o, cos_o in _TRIANGLE_OFFSETS
+                    ]
                     
-                    pygame.draw.polygon(screen, (0, 100, 255), [(tx1, ty1), (tx2, ty2), (tx3, ty3)])
+                    pygame.draw.polygon(screen, (0, 100, 255), triangle)
                     
                     # Draw distance and bearing
                     if distance < 1000:
@@ -283,30 +401,34 @@ class DisplayHandler:
                     else:
                         dist_text = f"{distance/1000:.2f} km"
                         
-                    dist_bearing_text = self.fonts['medium'].render(
+                    dist_bearing_text = self._render(
+                        'medium',
                         f"Distance: {dist_text}, Bearing: {bearing:.1f}°", 
-                        True, (255, 255, 255))
-                    screen.blit(dist_bearing_text, (20, DISPLAY_HEIGHT - 80))
+                        (255, 255, 255))
+                    screen.blit(dist_bearing_text, (20, height - 80))
             
             # Draw signal strength indicator
             if self.signal_strength != 0:
-                signal_text = self.fonts['medium'].render(
+                signal_text = self._render(
+                    'medium',
                     f"Signal: {self.signal_strength:.1f} dBm, Quality: {self.signal_quality:.1f} dB", 
-                    True, (200, 255, 200))
-                screen.blit(signal_text, (DISPLAY_WIDTH - signal_text.get_width() - 20, DISPLAY_HEIGHT - 50))
+                    (200, 255, 200))
+                screen.blit(signal_text, (width - signal_text.get_width() - 20, height - 50))
                 
             # Draw timestamp
-            time_text = self.fonts['small'].render(
-                f"Last update: {get_timestamp_str(self.last_update_time)}", 
-                True, (180, 180, 180))
-            screen.blit(time_text, (DISPLAY_WIDTH - time_text.get_width() - 20, DISPLAY_HEIGHT - 30))
+            time_text = self._render(
+                'small',
+                f"Last update: {self._fmt_ts(self.last_update_time)}", 
+                (180, 180, 180))
+            screen.blit(time_text, (width - time_text.get_width() - 20, height - 30))
         else:
             # No beacon position
-            waiting_text = self.fonts['large'].render(
+            waiting_text = self._render(
+                'large',
                 "Waiting for beacon signal...", 
-                True, (255, 255, 0))
-            screen.blit(waiting_text, (DISPLAY_WIDTH // 2 - waiting_text.get_width() // 2, 
-                                     DISPLAY_HEIGHT // 2 - waiting_text.get_height() // 2))
+                (255, 255, 0))
+            screen.blit(waiting_text, (width // 2 - waiting_text.get_width() // 2, 
+                                     height // 2 - waiting_text.get_height() // 2))
         
         # Update the display
         pygame.display.flip()
@@ -314,52 +436,53 @@ class DisplayHandler:
     def _update_console_display(self) -> None:
         """
         Update the console display (text-only).
-        """
-        # Clear console (cross-platform)
-        os.system('cls' if os.name == 'nt' else 'clear')
         
-        print("=" * 50)
-        print("  LoRa GPS Tracker - Console Display")
-        print("=" * 50)
+        The frame is assembled in memory and written with a single write,
+        preceded by an ANSI clear-screen sequence.
+        """
+        lines = [
+            "=" * 50,
+            "  LoRa GPS Tracker - Console Display",
+            "=" * 50
+        ]
         
         if self.beacon_position:
-            print(f"\nBeacon Position: {format_coordinates(*self.beacon_position)}")
+            lines.append(f"\nBeacon Position: {self._fmt_coord(*self.beacon_position)}")
             
             if self.tracker_position:
-                distance = calculate_distance(
-                    self.tracker_position[0], self.tracker_position[1],
-                    self.beacon_position[0], self.beacon_position[1]
-                )
-                bearing = calculate_bearing(
-                    self.tracker_position[0], self.tracker_position[1],
-                    self.beacon_position[0], self.beacon_position[1]
-                )
+                distance, bearing = self._get_distance_and_bearing()
                 
                 if distance < 1000:
                     dist_text = f"{distance:.1f} m"
                 else:
                     dist_text = f"{distance/1000:.2f} km"
                     
-                print(f"Distance to Beacon: {dist_text}")
-                print(f"Bearing to Beacon: {bearing:.1f}°")
+                lines.append(f"Distance to Beacon: {dist_text}")
+                lines.append(f"Bearing to Beacon: {bearing:.1f}°")
                 
             if self.signal_strength != 0:
-                print(f"\nSignal Strength: {self.signal_strength:.1f} dBm")
-                print(f"Signal Quality:  {self.signal_quality:.1f} dB")
+                lines.append(f"\nSignal Strength: {self.signal_strength:.1f} dBm")
+                lines.append(f"Signal Quality:  {self.signal_quality:.1f} dB")
                 
-            print(f"\nLast Update: {get_timestamp_str(self.last_update_time)}")
+            lines.append(f"\nLast Update: {self._fmt_ts(self.last_update_time)}")
             
         else:
-            print("\nWaiting for beacon signal...")
+            lines.append("\nWaiting for beacon signal...")
             
-        print("\n" + "=" * 50)
+        lines.append("\n" + "=" * 50)
         
         # History (last 5 positions)
-        if self.beacon_history:
-            print("\nRecent History:")
-            for i, entry in enumerate(reversed(self.beacon_history[:5])):
+        # Copy the deque first: the main thread may append to it while we iterate
+        recent = list(self.beacon_history)[-5:]
+        if recent:
+            lines.append("\nRecent History:")
+            for i, entry in enumerate(reversed(recent)):
                 pos = entry['position']
                 ts = entry['timestamp']
-                print(f" {i+1}. {format_coordinates(*pos)} at {get_timestamp_str(ts)}")
+                lines.append(f" {i+1}. {self._fmt_coord(*pos)} at {self._fmt_ts(ts)}")
                 
-        print("=" * 50)
+        lines.append("=" * 50)
+        
+        # Clear console and draw the frame in one write
+        sys.stdout.write(self._clear_seq + "\n".join(lines) + "\n")
+        sys.stdout.flush()
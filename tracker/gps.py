@@ -10,7 +10,8 @@ import logging
 import os
 import sys
 import queue
-from typing import Dict, Any, Optional, Tuple
+import select
+from typing import Dict, Any, Optional, Tuple, Callable
 
 from tracker.config import (
     GPS_ENABLED, GPS_PORT, GPS_BAUD_RATE, GPS_TIMEOUT
@@ -28,6 +29,14 @@ class GPSReceiver:
     distance and bearing to the beacon.
     """
     
+    __slots__ = (
+        'enabled', 'port', 'baud_rate', 'timeout',
+        'gps', 'serial', '_pynmea2', 'connected',
+        'position', 'altitude', 'speed', 'course', 'satellites',
+        'fix_quality', 'hdop', 'last_update',
+        'thread', 'stop_event', '_snapshot', 'position_callbacks'
+    )
+    
     def __init__(self):
         """Initialize the GPS receiver."""
         self.enabled = GPS_ENABLED
@@ -37,6 +46,7 @@ class GPSReceiver:
         
         self.gps = None
         self.serial = None
+        self._pynmea2 = None  # pynmea2 module, imported in connect()
         self.connected = False
         
         self.position = None  # (latitude, longitude)
@@ -48,6 +58,22 @@ class GPSReceiver:
         self.hdop = 0.0
         self.last_update = 0
         
+        # Dictionary reused by get_all_data()
+        self._snapshot = {
+            "latitude": None,
+            "longitude": None,
+            "altitude": 0.0,
+            "speed": 0.0,
+            "course": 0.0,
+            "satellites": 0,
+            "fix_quality": 0,
+            "hdop": 0.0,
+            "timestamp": 0
+        }
+        
+        # Called from the worker thread with (latitude, longitude) when the fix changes
+        self.position_callbacks = ()  # Replaced, never mutated, when a callback is added
+        
         # Thread control
         self.thread = None
         self.stop_event = threading.Event()
@@ -68,6 +94,9 @@ class GPSReceiver:
             import serial
             import pynmea2
             
+            # Keep the NMEA parser for the worker thread
+            self._pynmea2 = pynmea2
+            
             # Initialize the serial connection
             self.serial = serial.Serial(
                 port=self.port,
@@ -131,6 +160,20 @@ class GPSReceiver:
             
         logger.info("GPS thread stopped")
         
+    def register_callback(self, callback: Callable[[Tuple[float, float]], None]) -> None:
+        """
+        Register a callback function for position changes.
+        
+        The callback is called from the GPS thread whenever a valid fix
+        reports a new position.
+        
+        Args:
+            callback: Function to call with the new (latitude, longitude)
+        """
+        # Rebinding a new tuple is atomic, so the worker thread never sees
+        # a half-updated collection
+        self.position_callbacks = self.position_callbacks + (callback,)
+        
     def get_position(self) -> Optional[Tuple[float, float]]:
         """
         Get the current GPS position.
@@ -144,20 +187,24 @@ class GPSReceiver:
         """
         Get all available GPS data.
         
+        The same dictionary is updated in place and returned on every call;
+        callers that keep or modify it must make a copy.
+        
         Returns:
             Dictionary containing all GPS data
         """
-        return {
-            "latitude": self.position[0] if self.position else None,
-            "longitude": self.position[1] if self.position else None,
-            "altitude": self.altitude,
-            "speed": self.speed,
-            "course": self.course,
-            "satellites": self.satellites,
-            "fix_quality": self.fix_quality,
-            "hdop": self.hdop,
-            "timestamp": self.last_update
-        }
+        snapshot = self._snapshot
+        position = self.position
+        snapshot["latitude"] = position[0] if position else None
+        snapshot["longitude"] = position[1] if position else None
+        snapshot["altitude"] = self.altitude
+        snapshot["speed"] = self.speed
+        snapshot["course"] = self.course
+        snapshot["satellites"] = self.satellites
+        snapshot["fix_quality"] = self.fix_quality
+        snapshot["hdop"] = self.hdop
+        snapshot["timestamp"] = self.last_update
+        return snapshot
         
     def has_fix(self) -> bool:
         """
@@ -170,55 +217,101 @@ class GPSReceiver:
                 self.fix_quality > 0 and 
                 self.satellites >= 3)
         
+    def _handle_gga(self, msg) -> None:
+        """Handle a GGA sentence (Global Positioning System Fix Data)."""
+        if msg.latitude and msg.longitude:
+            self.position = (msg.latitude, msg.longitude)
+            self.altitude = float(msg.altitude) if msg.altitude else 0.0
+            self.satellites = int(msg.num_sats) if msg.num_sats else 0
+            self.fix_quality = int(msg.gps_qual) if msg.gps_qual else 0
+            self.hdop = float(msg.horizontal_dil) if msg.horizontal_dil else 0.0
+            self.last_update = time.time()
+            
+    def _handle_rmc(self, msg) -> None:
+        """Handle an RMC sentence (Recommended Minimum Navigation Information)."""
+        if msg.latitude and msg.longitude:
+            self.position = (msg.latitude, msg.longitude)
+            self.speed = float(msg.spd_over_grnd) if msg.spd_over_grnd else 0.0
+            self.course = float(msg.true_course) if msg.true_course else 0.0
+            self.last_update = time.time()
+            
+    def _handle_gsa(self, msg) -> None:
+        """Handle a GSA sentence (GPS DOP and active satellites)."""
+        self.fix_quality = int(msg.mode_fix_type) if msg.mode_fix_type else 0
+        self.hdop = float(msg.hdop) if msg.hdop else 0.0
+        
     def _gps_worker(self) -> None:
         """
         Worker thread function for reading GPS data.
         """
         logger.info("GPS worker thread started")
         
-        import pynmea2
+        # Bind the parser to locals for the read loop
+        parse = self._pynmea2.parse
+        ParseError = self._pynmea2.ParseError
+        
+        # Handlers keyed by the 3-character NMEA sentence id (b"$GPGGA" -> b"GGA").
+        # Sentences without a handler (GSV, VTG, GLL, ...) are never parsed.
+        handlers = {
+            b"GGA": self._handle_gga,
+            b"RMC": self._handle_rmc,
+            b"GSA": self._handle_gsa
+        }
+        
+        # Bytes received after the last complete line
+        buf = b""
+        
+        # Last position passed to the callbacks
+        last_position = None
         
         while not self.stop_event.is_set():
             try:
-                if self.serial and self.serial.in_waiting > 0:
-                    # Read a line from the GPS module
-                    line = self.serial.readline().decode('ascii', errors='replace').strip()
+                # Sleep in the kernel until data arrives; the 0.5 s timeout
+                # still lets the loop check stop_event
+                ready, _, _ = select.select([self.serial.fileno()], [], [], 0.5)
+                if not ready:
+                    continue
+                    
+                # Drain everything that is already buffered
+                data = self.serial.read(self.serial.in_waiting or 1)
+                if not data:
+                    continue
                     
-                    # Process the NMEA sentence
-                    if line.startswith('$'):
+                buf += data
+                lines = buf.split(b"\n")
+                buf = lines.pop()
+                
+                # NMEA sentences are at most 82 characters; drop runaway garbage
+                if len(buf) > 1024:
+                    buf = b""
+                    
+                # Keep only the newest sentence of each handled type, in stream
+                # order; older fixes in the same batch are already superseded
+                latest = {}
+                for raw in lines:
+                    sentence_id = raw[3:6]
+                    if raw[:1] == b"$" and sentence_id in handlers:
+                        latest.pop(sentence_id, None)
+                        latest[sentence_id] = raw
+                        
+                # Process the NMEA sentences
+                for sentence_id, raw in latest.items():
+                    try:
+                        line = raw.decode('ascii', errors='replace').strip()
+                        handlers[sentence_id](parse(line))
+                    except ParseError:
+                        pass  # Ignore parse errors for invalid NMEA sentences
+                        
+                # Notify callbacks when a valid fix moves
+                position = self.position
+                if position != last_position and self.has_fix():
+                    last_position = position
+                    for callback in self.position_callbacks:
                         try:
-                            msg = pynmea2.parse(line)
+                            callback(position)
+                        except Exception as e:
+                            logger.error(f"Error in position callback: {e}")
                             
-                            # Process different types of NMEA messages
-                            if isinstance(msg, pynmea2.GGA):
-                                # Global Positioning System Fix Data
-                                if msg.latitude and msg.longitude:
-                                    self.position = (msg.latitude, msg.longitude)
-                                    self.altitude = float(msg.altitude) if msg.altitude else 0.0
-                                    self.satellites = int(msg.num_sats) if msg.num_sats else 0
-                                    self.fix_quality = int(msg.gps_qual) if msg.gps_qual else 0
-                                    self.hdop = float(msg.horizontal_dil) if msg.horizontal_dil else 0.0
-                                    self.last_update = time.time()
-                                    
-                            elif isinstance(msg, pynmea2.RMC):
-                                # Recommended Minimum Navigation Information
-                                if msg.latitude and msg.longitude:
-                                    self.position = (msg.latitude, msg.longitude)
-                                    self.speed = float(msg.spd_over_grnd) if msg.spd_over_grnd else 0.0
-                                    self.course = float(msg.true_course) if msg.true_course else 0.0
-                                    self.last_update = time.time()
-                                    
-                            elif isinstance(msg, pynmea2.GSA):
-                                # GPS DOP and active satellites
-                                self.fix_quality = int(msg.mode_fix_type) if msg.mode_fix_type else 0
-                                self.hdop = float(msg.hdop) if msg.hdop else 0.0
-                                
-                        except pynmea2.ParseError:
-                            pass  # Ignore parse errors for invalid NMEA sentences
-                else:
-                    # Small delay to prevent CPU hogging when no data
-                    time.sleep(0.01)
-                    
             except Exception as e:
                 logger.error(f"Error reading GPS data: {e}")
                 time.sleep(1.0)  # Pause on error to prevent log flooding
@@ -3,51 +3,90 @@ Logging module for the LoRa GPS Tracker
 
 This module sets up logging configuration for the tracker device
 with structured logs and rotation.
+
+loguru is imported and its sinks are installed lazily on the first call to
+get_logger(), so importing this module has no side effects.
 """
 import os
 import sys
 from pathlib import Path
-from loguru import logger
 
 import config
 
-# Create log directory if it doesn't exist
-log_dir = os.path.dirname(config.LOG_FILE)
-Path(log_dir).mkdir(parents=True, exist_ok=True)
-
-# Remove default logger
-logger.remove()
-
-# Add console output
-logger.add(
-    sys.stdout,
-    level=config.LOG_LEVEL,
-    format="<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
-           "<level>{level: <8}</level> | "
-           "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
-           "<level>{message}</level>"
-)
-
-# Add file output with rotation
-logger.add(
-    config.LOG_FILE,
-    rotation=config.LOG_ROTATION,
-    retention=config.LOG_RETENTION,
-    level=config.LOG_LEVEL,
-    format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} - {message}",
-    backtrace=True,
-    diagnose=True
-)
-
-# Create logger for this module
-log = logger.bind(module="logger")
-
-log.debug("Logger initialized with level: {}", config.LOG_LEVEL)
-
-# Create data directory if it doesn't exist
-storage_dir = config.STORAGE_DIR
-Path(storage_dir).mkdir(parents=True, exist_ok=True)
-log.debug("Data directory created: {}", storage_dir)
+# Shared loguru logger, configured on first use
+_configured = False
+_logger = None
+
+# Set once the log and data directories exist
+_storage_ready = False
+
+
+def init_storage():
+    """
+    Create the log and data directories if they don't exist.
+
+    Called automatically on first use of get_logger(); applications can
+    call it earlier to create the directories eagerly.
+    """
+    global _storage_ready
+
+    if _storage_ready:
+        return
+
+    # Create log directory if it doesn't exist
+    log_dir = os.path.dirname(config.LOG_FILE)
+    Path(log_dir).mkdir(parents=True, exist_ok=True)
+
+    # Create data directory if it doesn't exist
+    Path(config.STORAGE_DIR).mkdir(parents=True, exist_ok=True)
+
+    _storage_ready = True
+
+
+def _configure():
+    """
+    Import loguru, install the console and file sinks and create the
+    log and data directories.
+    """
+    global _configured, _logger
+
+    from loguru import logger
+
+    init_storage()
+
+    # Remove default logger
+    logger.remove()
+
+    # Add console output
+    logger.add(
+        sys.stdout,
+        level=config.LOG_LEVEL,
+        format="<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
+               "<level>{level: <8}</level> | "
+               "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
+               "<level>{message}</level>"
+    )
+
+    # Add file output with rotation
+    logger.add(
+        config.LOG_FILE,
+        rotation=config.LOG_ROTATION,
+        retention=config.LOG_RETENTION,
+        level=config.LOG_LEVEL,
+        format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} - {message}",
+        backtrace=True,
+        diagnose=True
+    )
+
+    # Create logger for this module
+    log = logger.bind(module="logger")
+
+    log.debug("Logger initialized with level: {}", config.LOG_LEVEL)
+
+    log.debug("Data directory created: {}", config.STORAGE_DIR)
+
+    _logger = logger
+    _configured = True
 
 
 def get_logger(module_name):
@@ -60,4 +99,6 @@ def get_logger(module_name):
     Returns:
         logger: Logger instance for the module
     """
-    return logger.bind(module=module_name)
+    if not _configured:
+        _configure()
+    return _logger.bind(module=module_name)
@@ -5,12 +5,12 @@ This module handles receiving LoRa packets from the beacon transmitter.
 """
 
 import threading
-import queue
 import time
 import logging
 import json
 import os
 import sys
+from collections import deque
 from typing import Dict, Any, Optional, List, Tuple, Callable
 
 # Add the necessary module path for LoRaRF
@@ -25,10 +25,70 @@ from tracker.config import (
     LORA_BUSY_PIN, LORA_IRQ_PIN, LORA_TXEN_PIN, LORA_RXEN_PIN,
     LORA_RX_CONTINUOUS
 )
+from shared.packet_parser import PacketParser, MINIMAL_PACKET_MAGIC
+
+# Bound once so the receive path doesn't look it up per packet
+_decode_minimal = PacketParser.decode_minimal_packet
+
+# AES support is optional. Prefer pyca/cryptography (OpenSSL, which uses the
+# CPU's AES instructions where available) and fall back to pycryptodome.
+try:
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+    AES_BACKEND = "cryptography"
+except ImportError:
+    try:
+        from Crypto.Cipher import AES
+        AES_BACKEND = "pycryptodome"
+    except ImportError:
+        AES_BACKEND = None
+
+AES_BLOCK_SIZE = 16
+
+# orjson is optional; it parses bytes directly and is much faster than json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads  # Also accepts UTF-8 bytes
+
+# Minimal binary packets start with MINIMAL_PACKET_MAGIC, JSON packets with '{'
+_JSON_START = 0x7B  # '{'
+_MINIMAL_PACKET_SIZE = 12  # Unframed minimal packet from older transmitters
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+def _pkcs7_unpad(data: bytes) -> bytes:
+    """
+    Strip PKCS#7 padding.
+    
+    Args:
+        data: Decrypted data
+        
+    Returns:
+        Data without padding
+        
+    Raises:
+        ValueError: If the data is not correctly padded
+    """
+    pad_len = data[-1] if data else 0
+    if not 1 <= pad_len <= AES_BLOCK_SIZE or data[-pad_len:] != bytes((pad_len,)) * pad_len:
+        raise ValueError("Invalid padding")
+    return data[:-pad_len]
+
+class _Stats:
+    """Receiver statistics, updated by the receiver thread."""
+    
+    __slots__ = ('rx_packets', 'rx_bytes', 'rx_errors', 'last_rssi', 'last_snr', 'last_rx_time')
+    
+    def __init__(self):
+        self.rx_packets = 0
+        self.rx_bytes = 0
+        self.rx_errors = 0
+        self.last_rssi = 0
+        self.last_snr = 0
+        self.last_rx_time = 0
+
 class LoRaReceiver:
     """
     Class for interfacing with a LoRa module for receiving GPS data.
@@ -43,27 +103,43 @@ class LoRaReceiver:
         self.config = LORA_CONFIG
         self.encryption_key = LORA_ENCRYPTION_KEY
         
+        # Block decryption function, built once (ECB has no per-message state)
+        self._decrypt_blocks = None
+        if self.encryption_key:
+            key = self.encryption_key.encode('utf-8')
+            if len(key) < 16:
+                key = key.ljust(16, b'\0')  # Pad key if needed
+            elif len(key) > 16:
+                key = key[:16]  # Truncate if too long
+                
+            if AES_BACKEND == "cryptography":
+                self._decrypt_blocks = Cipher(algorithms.AES(key), modes.ECB()).decryptor().update
+            elif AES_BACKEND == "pycryptodome":
+                self._decrypt_blocks = AES.new(key, AES.MODE_ECB).decrypt
+            else:
+                logger.warning("No AES library available, packets will not be decrypted")
+        
         # SPI module
         self.lora = None
         self.connected = False
         
         # Message handling
-        self.rx_queue = queue.Queue(maxsize=LORA_MESSAGE_QUEUE_SIZE)
-        self.message_callbacks = {}
+        # Single producer/consumer: deque append/popleft are atomic, and maxlen
+        # drops the oldest message when the consumer falls behind
+        self.rx_queue = deque(maxlen=LORA_MESSAGE_QUEUE_SIZE)
+        self._rx_event = threading.Event()
+        self.message_callbacks = ()  # Replaced, never mutated, when a callback is added
+        
+        # Receive buffer, reused for every packet (SX126x payloads are at most 255 bytes)
+        self._rx_buf = bytearray(256)
+        self._rx_mv = memoryview(self._rx_buf)
         
         # Threads
         self.rx_thread = None
         self.stop_event = threading.Event()
         
         # Stats
-        self.stats = {
-            "rx_packets": 0,
-            "rx_bytes": 0,
-            "rx_errors": 0,
-            "last_rssi": 0,
-            "last_snr": 0,
-            "last_rx_time": 0
-        }
+        self.stats = _Stats()
         
     def connect(self) -> bool:
         """
@@ -100,9 +176,7 @@ class LoRaReceiver:
                 return False
                 
         except Exception as e:
-            logger.error(f"Failed to connect to LoRa module: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Failed to connect to LoRa module: {e}")
             self.connected = False
             return False
             
@@ -154,7 +228,9 @@ class LoRaReceiver:
         Args:
             callback: Function to call when a message is received
         """
-        self.message_callbacks.append(callback)
+        # Rebinding a new tuple is atomic, so the receiver thread never sees
+        # a half-updated collection
+        self.message_callbacks = self.message_callbacks + (callback,)
         
     def get_message(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
         """
@@ -166,14 +242,31 @@ class LoRaReceiver:
         Returns:
             Message dictionary, or None if timeout occurs
         """
-        try:
-            return self.rx_queue.get(timeout=timeout)
-        except queue.Empty:
-            return None
+        deadline = None if timeout is None else time.monotonic() + timeout
+        
+        while True:
+            try:
+                return self.rx_queue.popleft()
+            except IndexError:
+                pass
+                
+            # Clear before re-checking so a message appended in between still
+            # leaves the event set
+            self._rx_event.clear()
+            if self.rx_queue:
+                continue
+                
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+            self._rx_event.wait(remaining)
             
     def get_stats(self) -> Dict[str, Any]:
         """Get receiver statistics."""
-        return self.stats.copy()
+        stats = self.stats
+        return {name: getattr(stats, name) for name in _Stats.__slots__}
         
     def _configure_module(self) -> bool:
         """
@@ -221,71 +314,102 @@ class LoRaReceiver:
         """
         logger.info("LoRa receiver worker started")
         
-        while not self.stop_event.is_set():
+        # Bind everything the loop touches to locals once
+        lora = self.lora
+        request = lora.request
+        wait = lora.wait
+        status_of = lora.status
+        available = lora.available
+        read = lora.read
+        packet_rssi = lora.packetRssi
+        packet_snr = lora.snr
+        now = time.time
+        stats = self.stats
+        rx_buf = self._rx_buf
+        rx_mv = self._rx_mv
+        decrypt = self._decrypt
+        process_packet = self._process_packet
+        rx_queue_append = self.rx_queue.append
+        rx_event_set = self._rx_event.set
+        stop_is_set = self.stop_event.is_set
+        stop_wait = self.stop_event.wait
+        
+        # Error status codes
+        status_crc_err = lora.STATUS_CRC_ERR
+        status_header_err = lora.STATUS_HEADER_ERR
+        
+        while not stop_is_set():
             try:
                 # Request for receiving new LoRa packet
-                self.lora.request()
+                request()
                 
                 # Wait for incoming LoRa packet (with timeout)
-                result = self.lora.wait(0.1)  # 100ms timeout
+                result = wait(0.1)  # 100ms timeout
                 
                 if result:
-                    # Packet received
-                    payload = bytearray()
-                    
-                    # Read all available data
-                    while self.lora.available():
-                        payload.append(self.lora.read())
-                    
-                    # Update stats
-                    self.stats["rx_packets"] += 1
-                    self.stats["rx_bytes"] += len(payload)
-                    self.stats["last_rssi"] = self.lora.packetRssi()
-                    self.stats["last_snr"] = self.lora.snr()
-                    self.stats["last_rx_time"] = time.time()
-                    
-                    # Log packet reception
-                    logger.info(f"Received LoRa packet, RSSI: {self.stats['last_rssi']:.1f} dBm, "
-                               f"SNR: {self.stats['last_snr']:.1f} dB, Size: {len(payload)} bytes")
-                    
-                    # Process the packet
-                    try:
-                        # Try to decrypt if encryption is used
-                        decrypted_payload = self._decrypt(bytes(payload))
+                    # wait() also returns on CRC and header errors. status() only
+                    # decodes the IRQ flags wait() cached, so check it before
+                    # touching the payload; after a timeout it has nothing to report
+                    status = status_of()
+                    if status == status_crc_err:
+                        logger.warning("CRC error in received packet")
+                        stats.rx_errors += 1
+                    elif status == status_header_err:
+                        logger.warning("Header error in received packet")
+                        stats.rx_errors += 1
+                    else:
+                        # Packet received: read the whole payload with a single
+                        # buffer read instead of one SPI transfer per byte
+                        length = available()
+                        if length:
+                            rx_buf[:length] = read(length)
+                        payload = rx_mv[:length]  # Valid until the next packet
                         
-                        # Process as JSON
-                        message = self._process_packet(decrypted_payload)
+                        # Update stats
+                        stats.rx_packets += 1
+                        stats.rx_bytes += len(payload)
+                        stats.last_rssi = packet_rssi()
+                        stats.last_snr = packet_snr()
+                        stats.last_rx_time = now()
                         
-                        # Add to queue if valid
-                        if message and not self.rx_queue.full():
-                            self.rx_queue.put(message)
+                        # Log packet reception (formatted only if INFO is enabled)
+                        if logger.isEnabledFor(logging.INFO):
+                            logger.info("Received LoRa packet, RSSI: %.1f dBm, SNR: %.1f dB, Size: %d bytes",
+                                        stats.last_rssi, stats.last_snr, length)
+                        
+                        # Process the packet
+                        try:
+                            # Try to decrypt if encryption is used
+                            decrypted_payload = decrypt(payload)
+                            
+                            # Process as JSON
+                            message = process_packet(decrypted_payload)
                             
-                            # Call registered callbacks
-                            for callback in self.message_callbacks:
-                                try:
-                                    callback(message)
-                                except Exception as e:
-                                    logger.error(f"Error in message callback: {e}")
-                    except Exception as e:
-                        logger.error(f"Error processing packet: {e}")
-                        self.stats["rx_errors"] += 1
+                            # Add to queue if valid
+                            if message:
+                                rx_queue_append(message)
+                                rx_event_set()
+                                
+                                # Call registered callbacks (snapshot of the tuple)
+                                callbacks = self.message_callbacks
+                                for callback in callbacks:
+                                    try:
+                                        callback(message)
+                                    except Exception as e:
+                                        logger.error(f"Error in message callback: {e}")
+                        except Exception as e:
+                            logger.error(f"Error processing packet: {e}")
+                            stats.rx_errors += 1
                 
-                # Check for errors
-                status = self.lora.status()
-                if status == self.lora.STATUS_CRC_ERR:
-                    logger.warning("CRC error in received packet")
-                    self.stats["rx_errors"] += 1
-                elif status == self.lora.STATUS_HEADER_ERR:
-                    logger.warning("Header error in received packet")
-                    self.stats["rx_errors"] += 1
-                    
-                # Prevent CPU hogging if in non-continuous mode
-                if not LORA_RX_CONTINUOUS:
-                    time.sleep(0.01)  # 10ms pause between reception attempts
+                # Prevent CPU hogging if in non-continuous mode (10ms pause,
+                # cut short by stop())
+                if not LORA_RX_CONTINUOUS and stop_wait(0.01):
+                    break
                     
             except Exception as e:
                 logger.error(f"Error in LoRa receive thread: {e}")
-                time.sleep(1.0)  # Pause on error to prevent log flooding
+                if stop_wait(1.0):  # Pause on error to prevent log flooding
+                    break
         
         logger.info("LoRa receiver worker stopped")
     
@@ -300,35 +424,32 @@ class LoRaReceiver:
             Parsed message dictionary, or None if invalid
         """
         try:
-            # Try to parse as JSON first
-            try:
-                message = json.loads(payload.decode('utf-8'))
-                logger.debug(f"Received JSON message: {message}")
-                return message
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                # Not JSON, try binary format
-                pass
-                
-            # Try to parse as binary packet for minimal format
-            try:
-                from shared.packet_parser import PacketParser
-                latitude, longitude, timestamp = PacketParser.decode_minimal_packet(payload)
-                
-                # Convert to standard message format
-                message = {
-                    "lat": latitude,
-                    "lon": longitude,
-                    "ts": timestamp,
-                    "binary_format": True
-                }
-                logger.debug(f"Received binary format message: {message}")
+            first = payload[0] if payload else None
+            size = len(payload)
+            
+            # Dispatch on the first byte instead of trying each parser in turn
+            if ((first == MINIMAL_PACKET_MAGIC and size == _MINIMAL_PACKET_SIZE + 1) or
+                    size == _MINIMAL_PACKET_SIZE):  # Legacy packet without the magic byte
+                latitude, longitude, timestamp = _decode_minimal(payload)
+            elif first == _JSON_START:
+                message = _json_loads(payload)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Received JSON message: %s", message)
                 return message
-            except Exception as e:
-                logger.error(f"Failed to parse binary packet: {e}")
+            else:
+                logger.warning(f"Unknown packet format, raw bytes: {payload.hex()}")
+                return None
                 
-            # If we get here, we couldn't parse the packet
-            logger.warning(f"Unknown packet format, raw bytes: {payload.hex()}")
-            return None
+            # Convert to standard message format
+            message = {
+                "lat": latitude,
+                "lon": longitude,
+                "ts": timestamp,
+                "binary_format": True
+            }
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Received binary format message: %s", message)
+            return message
                 
         except Exception as e:
             logger.error(f"Error processing packet: {e}")
@@ -339,10 +460,10 @@ class LoRaReceiver:
         Decrypt packet data.
         
         Args:
-            data: Encrypted data
+            data: Encrypted data (any bytes-like object)
             
         Returns:
-            Decrypted data
+            Decrypted data as bytes
             
         Note: This is a simple placeholder. In a real implementation, 
         you would use proper encryption like AES-128.
@@ -352,39 +473,27 @@ class LoRaReceiver:
         # such as AES-CTR mode
         try:
             # If encryption is used
-            if self.encryption_key:
-                from Crypto.Cipher import AES
-                from Crypto.Util.Padding import unpad
-                
-                # For simplicity, we're using a fixed IV
-                # In a real implementation, you might derive this from packet metadata
-                iv = b'\x00' * 16
-                
-                # Create AES cipher in ECB mode (simplistic)
-                key = self.encryption_key.encode('utf-8')
-                if len(key) < 16:
-                    key = key.ljust(16, b'\0')  # Pad key if needed
-                elif len(key) > 16:
-                    key = key[:16]  # Truncate if too long
-                    
-                cipher = AES.new(key, AES.MODE_ECB)
-                
+            if self._decrypt_blocks is not None:
                 # In a real implementation, we'd use a proper mode like CTR
                 # which doesn't need padding
                 
-                # Decrypt the data
+                # The cryptography decryptor would buffer a partial block
+                # into the next packet, so reject unaligned data up front
+                if len(data) % AES_BLOCK_SIZE:
+                    raise ValueError("Data must be aligned to the AES block size")
+                    
+                # Decrypt the data once, then strip padding if present
+                decrypted = self._decrypt_blocks(data)
                 try:
-                    # Try with padding
-                    decrypted = unpad(cipher.decrypt(data), AES.block_size)
-                except Exception:
-                    # Try without padding if that fails
-                    decrypted = cipher.decrypt(data)
+                    decrypted = _pkcs7_unpad(decrypted)
+                except ValueError:
+                    pass  # Not padded, use the data as is
                 
                 return decrypted
             else:
                 # No encryption
-                return data
+                return bytes(data)
         except Exception as e:
             logger.error(f"Decryption error: {e}")
             # If decryption fails, return the original data
-            return data
+            return bytes(data)
@@ -8,19 +8,24 @@ It integrates all the components to receive and display tracking information.
 
 import os
 import sys
+import csv
 import time
+import queue
 import logging
 import signal
 import json
 import argparse
 from datetime import datetime
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
 
 # Add the project root to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from tracker.config import (
     APP_NAME, SHUTDOWN_TIMEOUT, LOCATION_LOG_FILE, DATA_DIR,
+    LOCATION_LOG_FLUSH_ROWS, LOCATION_LOG_FLUSH_INTERVAL,
     GPS_ENABLED, DISPLAY_ENABLED, DEBUG_MODE, SIMULATE_BEACON
 )
 from tracker.lora import LoRaReceiver
@@ -36,6 +41,10 @@ from shared.utils import (
 )
 from shared.packet_parser import PacketParser
 
+# Beacon simulator: random rows generated per batch, and values used per beacon
+SIM_POOL_SIZE = 1024
+SIM_SAMPLES_PER_BEACON = 7
+
 # Set up logging
 logger = setup_logging("tracker", level=logging.DEBUG if DEBUG_MODE else logging.INFO)
 
@@ -62,7 +71,19 @@ class TrackerController:
         # State
         self.running = True
         self.last_beacon_update = 0
+        
+        # Pre-generated random samples for the beacon simulator
+        self._sim_rng = np.random.default_rng()
+        self._sim_pool = []
+        self._sim_idx = 0
+        
+        # Events for the main loop, as (kind, data) tuples, posted by the
+        # LoRa and GPS callbacks
+        self.events = queue.Queue()
         self.location_log = None
+        self._log_writer = None
+        self._log_buf = []  # Rows waiting to be written to the location log
+        self._last_flush = time.time()
         
         # Initialize location log file
         self._init_location_log()
@@ -79,8 +100,9 @@ class TrackerController:
                 with open(LOCATION_LOG_FILE, 'w') as f:
                     f.write("timestamp,latitude,longitude,altitude,satellites,hdop,speed,course,distance,bearing,rssi,snr\n")
                     
-            # Open log file for appending
-            self.location_log = open(LOCATION_LOG_FILE, 'a')
+            # Open log file for appending; rows are written in batches
+            self.location_log = open(LOCATION_LOG_FILE, 'a', buffering=8192, newline='')
+            self._log_writer = csv.writer(self.location_log, lineterminator='\n')
             logger.info(f"Location log initialized at {LOCATION_LOG_FILE}")
             
         except Exception as e:
@@ -112,17 +134,44 @@ class TrackerController:
             rssi = data.get('rssi', '')
             snr = data.get('snr', '')
             
-            # Format as CSV line
-            line = f"{timestamp},{latitude},{longitude},{altitude},{satellites},{hdop},"
-            line += f"{speed},{course},{distance},{bearing},{rssi},{snr}\n"
-            
-            # Write to log file
-            self.location_log.write(line)
-            self.location_log.flush()  # Flush to ensure data is written immediately
+            self._log_buf.append((timestamp, latitude, longitude, altitude, satellites, hdop,
+                                  speed, course, distance, bearing, rssi, snr))
             
+            # Write in batches rather than flushing every row
+            if len(self._log_buf) >= LOCATION_LOG_FLUSH_ROWS:
+                self._flush_location_log()
+            else:
+                self._flush_location_log_if_due(time.time())
+                
         except Exception as e:
             logger.error(f"Failed to log location data: {e}")
             
+    def _flush_location_log_if_due(self, now: float) -> None:
+        """
+        Flush buffered location rows if LOCATION_LOG_FLUSH_INTERVAL has passed.
+        
+        Called for every new row and from the main loop's periodic wakeup, so
+        rows are not held in memory indefinitely when beacons stop arriving.
+        
+        Args:
+            now: Current time
+        """
+        if self._log_buf and now - self._last_flush >= LOCATION_LOG_FLUSH_INTERVAL:
+            self._flush_location_log(now)
+            
+    def _flush_location_log(self, now: Optional[float] = None) -> None:
+        """
+        Write buffered rows to the location log and flush it to disk.
+        
+        Args:
+            now: Current time, or None to read the clock
+        """
+        if self._log_buf:
+            self._log_writer.writerows(self._log_buf)
+            self._log_buf.clear()
+        self.location_log.flush()
+        self._last_flush = time.time() if now is None else now
+        
     def _process_message(self, message: Dict[str, Any]) -> None:
         """
         Process a received LoRa message.
@@ -145,8 +194,8 @@ class TrackerController:
             # Update display if available
             if self.display:
                 metadata = {
-                    'rssi': self.lora_receiver.stats.get('last_rssi', 0),
-                    'snr': self.lora_receiver.stats.get('last_snr', 0)
+                    'rssi': self.lora_receiver.stats.last_rssi,
+                    'snr': self.lora_receiver.stats.last_snr
                 }
                 self.display.update_beacon_position(
                     (message['lat'], message['lon']),
@@ -156,8 +205,8 @@ class TrackerController:
                 
             # Log the location
             message.update({
-                'rssi': self.lora_receiver.stats.get('last_rssi', 0),
-                'snr': self.lora_receiver.stats.get('last_snr', 0)
+                'rssi': self.lora_receiver.stats.last_rssi,
+                'snr': self.lora_receiver.stats.last_snr
             })
             self._log_location(message)
             
@@ -167,33 +216,88 @@ class TrackerController:
         except Exception as e:
             logger.error(f"Error processing message: {e}")
             
+    def _next_sim_sample(self) -> List[float]:
+        """
+        Get one row of uniform random samples in [-1, 1) for the simulator.
+        
+        Rows are generated in batches of SIM_POOL_SIZE.
+        
+        Returns:
+            List of SIM_SAMPLES_PER_BEACON floats
+        """
+        if self._sim_idx >= len(self._sim_pool):
+            self._sim_pool = self._sim_rng.uniform(
+                -1.0, 1.0, size=(SIM_POOL_SIZE, SIM_SAMPLES_PER_BEACON)
+            ).tolist()
+            self._sim_idx = 0
+            
+        row = self._sim_pool[self._sim_idx]
+        self._sim_idx += 1
+        return row
+        
     def _simulate_beacon(self) -> None:
         """Simulate a beacon signal for testing purposes."""
         from tracker.config import SIMULATE_BEACON_LOCATION
-        import random
+        
+        d_lat, d_lon, d_alt, r_spd, r_crs, d_rssi, d_snr = self._next_sim_sample()
         
         # Use simulated location with small random variations
-        lat = SIMULATE_BEACON_LOCATION[0] + random.uniform(-0.0001, 0.0001)
-        lon = SIMULATE_BEACON_LOCATION[1] + random.uniform(-0.0001, 0.0001)
+        lat = SIMULATE_BEACON_LOCATION[0] + d_lat * 0.0001
+        lon = SIMULATE_BEACON_LOCATION[1] + d_lon * 0.0001
         
         # Create simulated message
         message = {
             'lat': lat,
             'lon': lon,
-            'alt': 100 + random.uniform(-5, 5),
+            'alt': 100 + d_alt * 5,
             'sat': 8,
             'hdop': 1.2,
             'ts': int(time.time()),
-            'spd': random.uniform(0, 5),
-            'crs': random.uniform(0, 359)
+            'spd': (r_spd + 1.0) * 2.5,    # 0-5 km/h
+            'crs': (r_crs + 1.0) * 179.5   # 0-359 degrees
         }
         
         # Process the simulated message
         self._process_message(message)
         
         # Simulate signal strength
-        self.lora_receiver.stats['last_rssi'] = -65 + random.uniform(-10, 10)
-        self.lora_receiver.stats['last_snr'] = 9 + random.uniform(-2, 2)
+        self.lora_receiver.stats.last_rssi = -65 + d_rssi * 10
+        self.lora_receiver.stats.last_snr = 9 + d_snr * 2
+        
+    def _update_tracker_position(self, position: Tuple[float, float]) -> None:
+        """
+        Update navigation and display with a new tracker position.
+        
+        Args:
+            position: Tuple of (latitude, longitude)
+        """
+        self.navigation.update_tracker_position(*position)
+        
+        # Update display with tracker position
+        if self.display:
+            self.display.update_tracker_position(position)
+            
+    def _on_lora_message(self, message: Dict[str, Any]) -> None:
+        """
+        Forward a received LoRa message to the main loop.
+        
+        Called from the LoRa receiver thread.
+        
+        Args:
+            message: Dictionary containing the message data
+        """
+        self.events.put(('beacon', message))
+        
+    def _on_gps_position(self, position: Tuple[float, float]) -> None:
+        """
+        Forward a new tracker position to the main loop.
+        
+        Called from the GPS thread.
+        
+        Args:
+            position: Tuple of (latitude, longitude)
+        """
+        self.events.put(('position', position))
         
     def _signal_handler(self, sig, frame) -> None:
         """
@@ -217,6 +321,8 @@ class TrackerController:
         
         # Initialize LoRa receiver
         if not SIMULATE_BEACON:
+            self.lora_receiver.register_callback(self._on_lora_message)
+            
             if not self.lora_receiver.connect():
                 logger.error("Failed to connect to LoRa module")
                 return False
@@ -232,6 +338,8 @@ class TrackerController:
         
         # Initialize GPS if enabled
         if self.gps:
+            self.gps.register_callback(self._on_gps_position)
+            
             if not self.gps.connect():
                 logger.warning("Failed to connect to GPS module, continuing without GPS")
             else:
@@ -255,8 +363,12 @@ class TrackerController:
         """Clean shutdown of all components."""
         logger.info(f"Shutting down {APP_NAME}...")
         
-        # Close location log
+        # Write any buffered rows and close the location log
         if self.location_log:
+            try:
+                self._flush_location_log()
+            except Exception as e:
+                logger.error(f"Failed to flush location log: {e}")
             try:
                 self.location_log.close()
             except Exception:
@@ -284,35 +396,39 @@ class TrackerController:
             
         logger.info("Starting main loop")
         
+        # LoRa messages and GPS fixes are pushed onto the event queue by
+        # their receiver threads, so the loop sleeps until there is something to do
         try:
             while self.running:
-                # Process LoRa messages
-                if not SIMULATE_BEACON:
-                    message = self.lora_receiver.get_message(timeout=0.1)
-                    if message:
-                        self._process_message(message)
-                else:
-                    # In simulation mode, generate a beacon signal every 5 seconds
-                    if time.time() - self.last_beacon_update >= 5:
-                        self._simulate_beacon()
-                        
-                # Update tracker position from GPS if available
-                if self.gps and self.gps.has_fix():
-                    position = self.gps.get_position()
-                    if position:
-                        self.navigation.update_tracker_position(*position)
-                        
-                        # Update display with tracker position
-                        if self.display:
-                            self.display.update_tracker_position(position)
-                            
-                # Small delay to prevent CPU hogging
-                time.sleep(0.1)
+                timeout = 1.0  # Wake up periodically to notice shutdown
                 
+                # Write out buffered location rows once they are old enough
+                if self.location_log:
+                    try:
+                        self._flush_location_log_if_due(time.time())
+                    except Exception as e:
+                        logger.error(f"Failed to flush location log: {e}")
+                
+                # In simulation mode, generate a beacon signal every 5 seconds
+                if SIMULATE_BEACON:
+                    remaining = self.last_beacon_update + 5 - time.time()
+                    if remaining <= 0:
+                        self._simulate_beacon()
+                        continue
+                    timeout = min(timeout, remaining)
+                    
+                try:
+                    kind, data = self.events.get(timeout=timeout)
+                except queue.Empty:
+                    continue
+                    
+                if kind == 'beacon':
+                    self._process_message(data)
+                elif kind == 'position':
+                    self._update_tracker_position(data)
+                    
         except Exception as e:
-            logger.error(f"Error in main loop: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error in main loop: {e}")
             
         finally:
             # Ensure clean shutdown
@@ -5,16 +5,126 @@ This module handles navigation calculations between tracker and beacon.
 """
 
 import logging
+import math
 import time
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
-from shared.utils import (
-    calculate_distance, calculate_bearing, format_coordinates, get_timestamp_str
-)
+import numpy as np
+
+# numba is optional; without it the navigation kernel runs as plain Python
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+from shared.utils import format_coordinates, get_timestamp_str
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Number of most recent history points used for trend estimates
+TREND_WINDOW = 5
+
+# Distance/bearing results kept for recently seen position pairs. Positions
+# are rounded to 1e-6 degrees (about 0.1 m) for the lookup.
+CALC_CACHE_SIZE = 64
+CALC_CACHE_PRECISION = 6
+
+# 16-point compass names, indexed by bearing in 22.5 degree steps
+_CARDINALS = (
+    "N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
+    "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"
+)
+
+# Mean Earth radius in meters (same as shared.utils.calculate_distance)
+_EARTH_RADIUS = 6371000.0
+
+# Relative tolerance below which a trend regression is treated as degenerate
+_TREND_EPSILON = 1e-12
+
+def _distance_and_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> Tuple[float, float]:
+    """
+    Calculate the haversine distance and initial bearing from point 1 to point 2.
+    
+    Equivalent to shared.utils.calculate_distance and calculate_bearing,
+    but the trig terms both formulas need are computed only once.
+    
+    Args:
+        lat1: Latitude of point 1 in decimal degrees
+        lon1: Longitude of point 1 in decimal degrees
+        lat2: Latitude of point 2 in decimal degrees
+        lon2: Longitude of point 2 in decimal degrees
+        
+    Returns:
+        Tuple of (distance in meters, bearing in degrees 0-360 where 0 is North)
+    """
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    sin_phi1 = math.sin(phi1)
+    cos_phi1 = math.cos(phi1)
+    sin_phi2 = math.sin(phi2)
+    cos_phi2 = math.cos(phi2)
+    
+    # Half-angle terms for the haversine; the full-angle longitude terms the
+    # bearing needs follow from the double-angle identities
+    sin_half_dphi = math.sin((phi2 - phi1) * 0.5)
+    half_dlambda = math.radians(lon2 - lon1) * 0.5
+    sin_half_dlambda = math.sin(half_dlambda)
+    cos_half_dlambda = math.cos(half_dlambda)
+    sin_dlambda = 2.0 * sin_half_dlambda * cos_half_dlambda
+    cos_dlambda = 1.0 - 2.0 * sin_half_dlambda * sin_half_dlambda
+    
+    # Haversine distance
+    a = sin_half_dphi * sin_half_dphi + cos_phi1 * cos_phi2 * sin_half_dlambda * sin_half_dlambda
+    distance = _EARTH_RADIUS * 2.0 * math.atan2(math.sqrt(a), math.sqrt(1.0 - a))
+    
+    # Initial bearing, normalized to 0-360
+    y = sin_dlambda * cos_phi2
+    x = cos_phi1 * sin_phi2 - sin_phi1 * cos_phi2 * cos_dlambda
+    bearing = (math.degrees(math.atan2(y, x)) + 360.0) % 360.0
+    
+    return distance, bearing
+
+if njit is not None:
+    _distance_and_bearing = njit(cache=True, fastmath=True)(_distance_and_bearing)
+
+def _distance_bearing_vec(lat1: float, lon1: float, lat2: np.ndarray,
+                          lon2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized _distance_and_bearing from one point to many.
+    
+    Args:
+        lat1: Latitude of the origin in decimal degrees
+        lon1: Longitude of the origin in decimal degrees
+        lat2: Array of destination latitudes in decimal degrees
+        lon2: Array of destination longitudes in decimal degrees
+        
+    Returns:
+        Tuple of (distances in meters, bearings in degrees 0-360) arrays
+    """
+    phi1 = math.radians(lat1)
+    phi2 = np.radians(lat2)
+    sin_phi1 = math.sin(phi1)
+    cos_phi1 = math.cos(phi1)
+    sin_phi2 = np.sin(phi2)
+    cos_phi2 = np.cos(phi2)
+    
+    sin_half_dphi = np.sin((phi2 - phi1) * 0.5)
+    half_dlambda = np.radians(lon2 - lon1) * 0.5
+    sin_half_dlambda = np.sin(half_dlambda)
+    cos_half_dlambda = np.cos(half_dlambda)
+    sin_dlambda = 2.0 * sin_half_dlambda * cos_half_dlambda
+    cos_dlambda = 1.0 - 2.0 * sin_half_dlambda * sin_half_dlambda
+    
+    a = sin_half_dphi * sin_half_dphi + cos_phi1 * cos_phi2 * sin_half_dlambda * sin_half_dlambda
+    distances = _EARTH_RADIUS * 2.0 * np.arctan2(np.sqrt(a), np.sqrt(1.0 - a))
+    
+    y = sin_dlambda * cos_phi2
+    x = cos_phi1 * sin_phi2 - sin_phi1 * cos_phi2 * cos_dlambda
+    bearings = (np.degrees(np.arctan2(y, x)) + 360.0) % 360.0
+    
+    return distances, bearings
+
 class NavigationCalculator:
     """
     Class for calculating navigation parameters between tracker and beacon.
@@ -23,8 +133,23 @@ class NavigationCalculator:
     navigation parameters between the tracker and the beacon.
     """
     
+    __slots__ = (
+        'tracker_position', 'beacon_position',
+        'distance', 'bearing', 'last_calc_time',
+        '_calc_key', '_calc_cache', '_formatted_distance', '_formatted_bearing',
+        'max_history_size', '_hist_t', '_hist_dist', '_hist_bear',
+        '_hist_cos', '_hist_sin', '_hist_head', '_hist_n',
+        '_t0', '_sum_t', '_sum_tt', '_sum_d', '_sum_td',
+        '_sum_c', '_sum_tc', '_sum_s', '_sum_ts',
+        '_version', '_cached_trends', '_nav_data',
+        'beacon_latitudes', 'beacon_longitudes', 'beacon_distances', 'beacon_bearings'
+    )
+    
     def __init__(self):
         """Initialize the navigation calculator."""
+        # Compile the numba kernel now rather than on the first real fix
+        _distance_and_bearing(0.0, 0.0, 0.0, 0.0)
+        
         # Current positions
         self.tracker_position: Optional[Tuple[float, float]] = None
         self.beacon_position: Optional[Tuple[float, float]] = None
@@ -34,10 +159,73 @@ class NavigationCalculator:
         self.bearing: Optional[float] = None
         self.last_calc_time: float = 0
         
-        # History for trend analysis
-        self.distance_history: list = []
-        self.bearing_history: list = []
+        # Positions the current distance/bearing were calculated for, and
+        # results for recent position pairs
+        self._calc_key = None
+        self._calc_cache = {}
+        
+        # Display strings for the current distance and bearing
+        self._formatted_distance: Optional[str] = None
+        self._formatted_bearing: Optional[str] = None
+        
+        # History for trend analysis: fixed-size ring buffers holding the
+        # time, distance and bearing of each calculation (distance and
+        # bearing are always recorded together, so they share the index).
+        # Bearings are also kept as unit vectors for the bearing trend.
         self.max_history_size: int = 20
+        self._hist_t = np.empty(self.max_history_size)
+        self._hist_dist = np.empty(self.max_history_size)
+        self._hist_bear = np.empty(self.max_history_size)
+        self._hist_cos = np.empty(self.max_history_size)
+        self._hist_sin = np.empty(self.max_history_size)
+        self._hist_head = 0  # Next slot to write
+        self._hist_n = 0     # Number of valid entries
+        
+        # Running sums over the last TREND_WINDOW samples for the trend
+        # regression, with times taken relative to _t0: t, t^2, and the value
+        # and t*value for distance (d), cos(bearing) (c) and sin(bearing) (s)
+        self._t0 = 0.0
+        self._sum_t = self._sum_tt = 0.0
+        self._sum_d = self._sum_td = 0.0
+        self._sum_c = self._sum_tc = 0.0
+        self._sum_s = self._sum_ts = 0.0
+        
+        # Bumped whenever history is recorded; trends are only recalculated
+        # when it has moved on from the version they were calculated for
+        self._version = 0
+        self._cached_trends = (-1, None, None)  # (version, distance trend, bearing trend)
+        
+        # Additional beacons tracked with update_beacons(), as parallel arrays
+        self.beacon_latitudes: Optional[np.ndarray] = None
+        self.beacon_longitudes: Optional[np.ndarray] = None
+        self.beacon_distances: Optional[np.ndarray] = None
+        self.beacon_bearings: Optional[np.ndarray] = None
+        
+        # Returned by get_navigation_data(), updated in place
+        self._nav_data: Dict[str, Any] = {
+            "tracker_position": None,
+            "beacon_position": None,
+            "distance": None,
+            "bearing": None,
+            "distance_trend": None,
+            "bearing_trend": None,
+            "last_calc_time": 0
+        }
+        
+    def history(self) -> Tuple[List[Tuple[float, float]], List[Tuple[float, float]]]:
+        """
+        Get the recorded distance and bearing history.
+        
+        The history is kept in ring buffers; the lists are built on demand.
+        
+        Returns:
+            Tuple of (distance history, bearing history), each a list of
+            (time, value) tuples, oldest first
+        """
+        idx = self._history_index(self._hist_n)
+        times = self._hist_t[idx].tolist()
+        return (list(zip(times, self._hist_dist[idx].tolist())),
+                list(zip(times, self._hist_bear[idx].tolist())))
         
     def update_tracker_position(self, latitude: float, longitude: float) -> None:
         """
@@ -49,6 +237,8 @@ class NavigationCalculator:
         """
         self.tracker_position = (latitude, longitude)
         self._update_calculations()
+        if self.beacon_latitudes is not None:
+            self._update_beacon_arrays()
         
     def update_beacon_position(self, latitude: float, longitude: float) -> None:
         """
@@ -61,127 +251,251 @@ class NavigationCalculator:
         self.beacon_position = (latitude, longitude)
         self._update_calculations()
         
+    def update_beacons(self, latitudes, longitudes) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Update the positions of several beacons at once.
+        
+        Distances and bearings to all of them are calculated in one
+        vectorized pass and kept in beacon_distances and beacon_bearings,
+        which are refreshed whenever the tracker moves. This is independent
+        of the single beacon set with update_beacon_position().
+        
+        Args:
+            latitudes: Beacon latitudes in decimal degrees (array-like)
+            longitudes: Beacon longitudes in decimal degrees (array-like)
+            
+        Returns:
+            Tuple of (distances in meters, bearings in degrees) arrays,
+            or None if the tracker position is not known yet
+        """
+        self.beacon_latitudes = np.asarray(latitudes, dtype=float)
+        self.beacon_longitudes = np.asarray(longitudes, dtype=float)
+        self._update_beacon_arrays()
+        if self.beacon_distances is None:
+            return None
+        return self.beacon_distances, self.beacon_bearings
+        
+    def _update_beacon_arrays(self) -> None:
+        """Recalculate distances and bearings to the beacons set with update_beacons()."""
+        if self.tracker_position is None:
+            self.beacon_distances = None
+            self.beacon_bearings = None
+            return
+            
+        self.beacon_distances, self.beacon_bearings = _distance_bearing_vec(
+            self.tracker_position[0], self.tracker_position[1],
+            self.beacon_latitudes, self.beacon_longitudes
+        )
+        
     def get_navigation_data(self) -> Dict[str, Any]:
         """
         Get current navigation data.
         
+        The same dictionary is updated in place and returned on every call;
+        callers that keep or modify it must make a copy.
+        
         Returns:
             Dictionary containing navigation data
         """
-        return {
-            "tracker_position": self.tracker_position,
-            "beacon_position": self.beacon_position,
-            "distance": self.distance,
-            "bearing": self.bearing,
-            "distance_trend": self._calculate_distance_trend(),
-            "bearing_trend": self._calculate_bearing_trend(),
-            "last_calc_time": self.last_calc_time
-        }
+        version, distance_trend, bearing_trend = self._cached_trends
+        if version != self._version:
+            distance_trend, bearing_trend = self._calculate_trends()
+            self._cached_trends = (self._version, distance_trend, bearing_trend)
+            
+        nav_data = self._nav_data
+        nav_data["tracker_position"] = self.tracker_position
+        nav_data["beacon_position"] = self.beacon_position
+        nav_data["distance"] = self.distance
+        nav_data["bearing"] = self.bearing
+        nav_data["distance_trend"] = distance_trend
+        nav_data["bearing_trend"] = bearing_trend
+        nav_data["last_calc_time"] = self.last_calc_time
+        return nav_data
         
     def _update_calculations(self) -> None:
         """Update navigation calculations if both positions are available."""
         if self.tracker_position and self.beacon_position:
-            # Calculate distance and bearing
-            self.distance = calculate_distance(
-                self.tracker_position[0], self.tracker_position[1],
-                self.beacon_position[0], self.beacon_position[1]
-            )
+            # Calculate distance and bearing, unless neither position changed
+            # (a stationary GPS keeps reporting the same fix)
+            key = (self.tracker_position, self.beacon_position)
+            if key != self._calc_key:
+                self.distance, self.bearing = self._lookup_distance_and_bearing()
+                self._calc_key = key
+                
+                # Format once per change rather than on every display refresh
+                if self.distance < 1000:
+                    self._formatted_distance = f"{self.distance:.1f} m"
+                else:
+                    self._formatted_distance = f"{self.distance/1000:.2f} km"
+                    
+                # Cardinal direction (bearing is 0-360, so adding 0.5 rounds
+                # to the nearest 22.5 degree step)
+                cardinal = _CARDINALS[int(self.bearing / 22.5 + 0.5) % 16]
+                self._formatted_bearing = f"{self.bearing:.1f}° ({cardinal})"
+                
+            now = time.time()
             
-            self.bearing = calculate_bearing(
-                self.tracker_position[0], self.tracker_position[1],
-                self.beacon_position[0], self.beacon_position[1]
-            )
+            bearing_rad = math.radians(self.bearing)
+            cos_b = math.cos(bearing_rad)
+            sin_b = math.sin(bearing_rad)
             
-            # Update history
-            self.distance_history.append((time.time(), self.distance))
-            self.bearing_history.append((time.time(), self.bearing))
+            # Slide the trend window: take out the sample that drops out of it
+            # (before its slot can be overwritten) and add the new one
+            head = self._hist_head
+            if self._hist_n >= TREND_WINDOW:
+                old = (head - TREND_WINDOW) % self.max_history_size
+                self._add_trend_sample(float(self._hist_t[old]) - self._t0, float(self._hist_dist[old]),
+                                       float(self._hist_cos[old]), float(self._hist_sin[old]), -1.0)
+            elif self._hist_n == 0:
+                self._t0 = now
+            self._add_trend_sample(now - self._t0, self.distance, cos_b, sin_b, 1.0)
             
-            # Keep history within size limit
-            if len(self.distance_history) > self.max_history_size:
-                self.distance_history = self.distance_history[-self.max_history_size:]
-                
-            if len(self.bearing_history) > self.max_history_size:
-                self.bearing_history = self.bearing_history[-self.max_history_size:]
+            # Update history, overwriting the oldest entry once full
+            self._hist_t[head] = now
+            self._hist_dist[head] = self.distance
+            self._hist_bear[head] = self.bearing
+            self._hist_cos[head] = cos_b
+            self._hist_sin[head] = sin_b
+            self._hist_head = (head + 1) % self.max_history_size
+            if self._hist_n < self.max_history_size:
+                self._hist_n += 1
+            self._version += 1
+            
+            # Recompute the sums exactly each time the ring wraps, so rounding
+            # errors from the add/remove updates can't build up
+            if self._hist_head == 0:
+                self._reset_trend_sums()
                 
-            self.last_calc_time = time.time()
+            self.last_calc_time = now
             
-            logger.debug(f"Navigation update: Distance: {self.distance:.1f}m, "
-                        f"Bearing: {self.bearing:.1f}°")
+            logger.debug("Navigation update: Distance: %.1fm, Bearing: %.1f°",
+                         self.distance, self.bearing)
         else:
             # If either position is missing, calculations are not possible
             self.distance = None
             self.bearing = None
+            self._calc_key = None
+            self._formatted_distance = None
+            self._formatted_bearing = None
             
-    def _calculate_distance_trend(self) -> Optional[float]:
+    def _lookup_distance_and_bearing(self) -> Tuple[float, float]:
         """
-        Calculate the trend in distance over time.
+        Get distance and bearing for the current positions, from the cache
+        when a nearly identical position pair was seen recently.
         
         Returns:
-            Rate of change in meters per second (negative means getting closer),
-            or None if insufficient data
+            Tuple of (distance in meters, bearing in degrees)
         """
-        if len(self.distance_history) < 2:
-            return None
+        tracker_lat, tracker_lon = self.tracker_position
+        beacon_lat, beacon_lon = self.beacon_position
+        key = (round(tracker_lat, CALC_CACHE_PRECISION), round(tracker_lon, CALC_CACHE_PRECISION),
+               round(beacon_lat, CALC_CACHE_PRECISION), round(beacon_lon, CALC_CACHE_PRECISION))
+        
+        result = self._calc_cache.get(key)
+        if result is None:
+            result = _distance_and_bearing(tracker_lat, tracker_lon, beacon_lat, beacon_lon)
             
-        # Use last few points for trend
-        points = self.distance_history[-5:] if len(self.distance_history) >= 5 else self.distance_history
-        
-        # Simple linear regression
-        n = len(points)
-        sum_x = sum(p[0] for p in points)  # Sum of times
-        sum_y = sum(p[1] for p in points)  # Sum of distances
-        sum_xy = sum(p[0] * p[1] for p in points)
-        sum_xx = sum(p[0] * p[0] for p in points)
-        
-        # Calculate slope (meters per second)
-        try:
-            slope = (n * sum_xy - sum_x * sum_y) / (n * sum_xx - sum_x * sum_x)
-            return slope
-        except ZeroDivisionError:
-            return None
+            # Evict the oldest entry when the cache is full
+            if len(self._calc_cache) >= CALC_CACHE_SIZE:
+                self._calc_cache.pop(next(iter(self._calc_cache)))
+            self._calc_cache[key] = result
+        return result
+        
+    def _add_trend_sample(self, t: float, d: float, c: float, s: float, sign: float) -> None:
+        """
+        Add a sample to, or remove it from, the trend running sums.
+        
+        Args:
+            t: Sample time relative to _t0
+            d: Distance
+            c: Cosine of the bearing
+            s: Sine of the bearing
+            sign: 1.0 to add the sample, -1.0 to remove it
+        """
+        self._sum_t += sign * t
+        self._sum_tt += sign * t * t
+        self._sum_d += sign * d
+        self._sum_td += sign * t * d
+        self._sum_c += sign * c
+        self._sum_tc += sign * t * c
+        self._sum_s += sign * s
+        self._sum_ts += sign * t * s
+        
+    def _reset_trend_sums(self) -> None:
+        """Recompute the trend running sums from the current trend window."""
+        idx = self._history_index(min(self._hist_n, TREND_WINDOW))
+        
+        # Rebase times on the oldest sample in the window
+        self._t0 = float(self._hist_t[idx[0]])
+        t = self._hist_t[idx] - self._t0
+        d = self._hist_dist[idx]
+        c = self._hist_cos[idx]
+        s = self._hist_sin[idx]
+        
+        self._sum_t = float(t.sum())
+        self._sum_tt = float(np.dot(t, t))
+        self._sum_d = float(d.sum())
+        self._sum_td = float(np.dot(t, d))
+        self._sum_c = float(c.sum())
+        self._sum_tc = float(np.dot(t, c))
+        self._sum_s = float(s.sum())
+        self._sum_ts = float(np.dot(t, s))
+        
+    def _history_index(self, count: int) -> np.ndarray:
+        """
+        Get ring buffer indices of the most recent history entries.
+        
+        Args:
+            count: Number of entries (at most the number stored)
             
-    def _calculate_bearing_trend(self) -> Optional[float]:
+        Returns:
+            Index array, oldest entry first
+        """
+        return np.arange(self._hist_head - count, self._hist_head) % self.max_history_size
+        
+    def _calculate_trends(self) -> Tuple[Optional[float], Optional[float]]:
         """
-        Calculate the trend in bearing over time.
+        Calculate the distance and bearing trends over time.
+        
+        Both trends are least-squares fits of distance, cos(bearing) and
+        sin(bearing) against time over the last TREND_WINDOW points, taken
+        from the running sums kept by _update_calculations.
         
         Returns:
-            Rate of change in degrees per second (positive means turning clockwise),
-            or None if insufficient data
+            Tuple of (distance trend in meters per second, negative means
+            getting closer; bearing trend in degrees per second, positive
+            means turning clockwise). Each is None if there is insufficient data.
         """
-        if len(self.bearing_history) < 2:
-            return None
-            
-        # Bearing requires special handling due to the 0-360 discontinuity
-        # Convert to a continuous scale
-        
-        # Use last few points for trend
-        raw_points = self.bearing_history[-5:] if len(self.bearing_history) >= 5 else self.bearing_history
-        
-        # Unwrap bearings to handle the 0-360 discontinuity
-        prev_bearing = raw_points[0][1]
-        points = [(raw_points[0][0], prev_bearing)]
-        
-        for t, b in raw_points[1:]:
-            # Calculate smallest angle difference
-            diff = ((b - prev_bearing + 180) % 360) - 180
-            unwrapped_bearing = prev_bearing + diff
-            points.append((t, unwrapped_bearing))
-            prev_bearing = unwrapped_bearing
-            
-        # Simple linear regression on unwrapped bearings
-        n = len(points)
-        sum_x = sum(p[0] for p in points)  # Sum of times
-        sum_y = sum(p[1] for p in points)  # Sum of unwrapped bearings
-        sum_xy = sum(p[0] * p[1] for p in points)
-        sum_xx = sum(p[0] * p[0] for p in points)
-        
-        # Calculate slope (degrees per second)
-        try:
-            slope = (n * sum_xy - sum_x * sum_y) / (n * sum_xx - sum_x * sum_x)
-            return slope
-        except ZeroDivisionError:
-            return None
+        if self._hist_n < 2:
+            return None, None
             
+        k = min(self._hist_n, TREND_WINDOW)
+        sum_t = self._sum_t
+        
+        # Linear regression slopes: (k*sum_ty - sum_t*sum_y) / (k*sum_tt - sum_t^2).
+        # The denominator is k^2 times the variance of the sample times; it is
+        # zero when they are all equal, up to rounding in the running sums
+        denom = k * self._sum_tt - sum_t * sum_t
+        if denom <= _TREND_EPSILON * k * self._sum_tt:
+            return None, None  # All samples at the same time
+        distance_trend = (k * self._sum_td - sum_t * self._sum_d) / denom
+        dcos = (k * self._sum_tc - sum_t * self._sum_c) / denom
+        dsin = (k * self._sum_ts - sum_t * self._sum_s) / denom
+        
+        # Bearings are fitted on the unit circle so the 0-360 discontinuity
+        # never matters: with C(t) and S(t) linear, the angular rate is
+        # d/dt atan2(S, C) = (C*S' - S*C') / (C^2 + S^2) at the mean time,
+        # where the fitted C and S are the sample means
+        mean_cos = self._sum_c / k
+        mean_sin = self._sum_s / k
+        resultant = mean_cos * mean_cos + mean_sin * mean_sin
+        if resultant <= _TREND_EPSILON:
+            return distance_trend, None  # Bearings cancel out, no mean direction
+        rate = (mean_cos * dsin - mean_sin * dcos) / resultant
+        
+        # Radians to degrees per second
+        return distance_trend, math.degrees(rate)
+        
     def get_formatted_distance(self) -> str:
         """
         Get a formatted string representation of the distance.
@@ -189,13 +503,9 @@ class NavigationCalculator:
         Returns:
             Formatted distance string, or 'N/A' if not available
         """
-        if self.distance is None:
+        if self._formatted_distance is None:
             return "N/A"
-            
-        if self.distance < 1000:
-            return f"{self.distance:.1f} m"
-        else:
-            return f"{self.distance/1000:.2f} km"
+        return self._formatted_distance
             
     def get_formatted_bearing(self) -> str:
         """
@@ -204,17 +514,6 @@ class NavigationCalculator:
         Returns:
             Formatted bearing string, or 'N/A' if not available
         """
-        if self.bearing is None:
+        if self._formatted_bearing is None:
             return "N/A"
-            
-        # Get cardinal direction
-        cardinal_directions = [
-            "N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
-            "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"
-        ]
-        
-        # Convert bearing to 0-15 index
-        index = round(self.bearing / 22.5) % 16
-        cardinal = cardinal_directions[index]
-        
-        return f"{self.bearing:.1f}° ({cardinal})"
+        return self._formatted_bearing